@@ -4,6 +4,61 @@ from unittest.mock import Mock
 
 import pytest
 from lambda_api import API, Context, HTTPMethod, Request, Response
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in one session-wide event loop.
+
+    asyncio_mode = auto (pytest.ini) collects ``async def`` tests without a
+    marker; sharing the loop avoids creating and closing one per test.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+class AsyncSpy:
+    """Minimal async callable that records its calls.
+
+    Covers the parts of the ``AsyncMock`` API the tests use, without its
+    per-call introspection and bookkeeping.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    def __call__(self, *args, **kwargs):
+        # Record eagerly so the call counts even before it is awaited
+        self.calls.append((args, kwargs))
+        return self._result()
+
+    async def _result(self):
+        return self.return_value
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"called {self.call_count} times"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], f"calls: {self.calls}"
+
+    def assert_not_called(self):
+        assert self.call_count == 0, f"called {self.call_count} times"
+
+    def reset_mock(self):
+        self.calls.clear()
+
+
+@pytest.fixture
+def async_spy():
+    """Provide the AsyncSpy class for creating handler spies."""
+    return AsyncSpy
 
 
 @pytest.fixture
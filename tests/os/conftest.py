@@ -0,0 +1,20 @@
+"""Common fixtures for the data access tests."""
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is an optional test dependency and unavailable on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed.
+
+        Versions of pytest-asyncio without loop factories ignore this hook and
+        keep the default event loop.
+        """
+        return {"uvloop": uvloop.new_event_loop}
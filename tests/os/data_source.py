@@ -1,4 +1,5 @@
 """Data source interface and abstract base classes."""
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, List, Optional, TypeVar
@@ -84,6 +85,10 @@ class DataSource(Generic[T], ABC):
 class OpenSearchDataSource(DataSource[T], ABC):
     """Base class for OpenSearch data sources."""
 
+    # Result sets larger than this are transformed in the default executor
+    # so hydration does not block the event loop
+    transform_executor_threshold = 200
+
     def __init__(self, client, index):
         """Initialize the data source.
 
@@ -99,7 +104,9 @@ class OpenSearchDataSource(DataSource[T], ABC):
 
         Args:
             query: Query DSL
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (page, size, sort,
+                source_includes, aggs, index to search instead of the data
+                source's index, and raw to skip transforming hits)
 
         Returns:
             SearchResult: Search results
@@ -113,7 +120,7 @@ class OpenSearchDataSource(DataSource[T], ABC):
 
         # Perform the search
         result = await self.client.search(
-            index=self.index,
+            index=kwargs.get("index", self.index),
             query=query,
             sort=sort,
             page=page,
@@ -122,10 +129,11 @@ class OpenSearchDataSource(DataSource[T], ABC):
             aggs=aggs,
         )
 
-        # Transform hits if needed
+        # Transform hits if needed; raw callers (e.g. re-indexing pipelines)
+        # get the source dicts back untouched
         hits = result.hits
-        if hasattr(self, "transform_record"):
-            hits = [self.transform_record(hit) for hit in hits]
+        if not kwargs.get("raw", False):
+            hits = await self._hydrate(hits)
 
         return SearchResult(
             hits=hits,
@@ -134,6 +142,36 @@ class OpenSearchDataSource(DataSource[T], ABC):
             took_ms=result.took_ms,
         )
 
+    async def _hydrate(self, hits: List[Any]) -> List[Any]:
+        """Transform raw hits, in the default executor for large result sets.
+
+        Args:
+            hits: Raw hits from OpenSearch
+
+        Returns:
+            List[Any]: Transformed hits
+        """
+        if len(hits) > self.transform_executor_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._transform_hits, hits)
+        return self._transform_hits(hits)
+
+    def _transform_hits(self, hits: List[Any]) -> List[Any]:
+        """Transform raw hits using the subclass transform hooks, if any.
+
+        Args:
+            hits: Raw hits from OpenSearch
+
+        Returns:
+            List[Any]: Transformed hits
+        """
+        if hasattr(self, "transform_records"):
+            return self.transform_records(hits)
+        if hasattr(self, "transform_record"):
+            transform = self.transform_record
+            return [transform(hit) for hit in hits]
+        return hits
+
     async def get_by_id(self, id: str, **kwargs) -> Optional[T]:
         """Get a record by ID from OpenSearch.
 
@@ -1,18 +1,51 @@
 """Factory for creating data access components."""
+import importlib
 import logging
 import os
-from typing import Dict, Generic, Optional, Type, TypeVar
-
-from .clients.opensearch_client import OpenSearchClient
-from .dao.regulatory_dao import RegulatoryDAO
-from .sources.data_source import DataSource
-from .sources.regulatory_data_source import RegulatoryDataSource
+import threading
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Type,
+                    TypeVar)
+
+if TYPE_CHECKING:
+    from .clients.opensearch_client import OpenSearchClient
+    from .dao.regulatory_dao import RegulatoryDAO
+    from .sources.regulatory_data_source import RegulatoryDataSource
+else:
+    # Imported on first use (see _component) so importing the factory does
+    # not pull in opensearchpy and its dependencies, e.g. on cold starts.
+    # The names stay module attributes so tests can patch them.
+    OpenSearchClient = None
+    RegulatoryDAO = None
+    RegulatoryDataSource = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Modules providing the lazily imported component classes
+_LAZY_IMPORTS = {
+    "OpenSearchClient": ".clients.opensearch_client",
+    "RegulatoryDAO": ".dao.regulatory_dao",
+    "RegulatoryDataSource": ".sources.regulatory_data_source",
+}
+
+
+def _component(name: str) -> Any:
+    """Get a component class, importing its module on first use.
+
+    Args:
+        name: Class name, one of ``_LAZY_IMPORTS``
+
+    Returns:
+        Any: Component class
+    """
+    cls = globals()[name]
+    if cls is None:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __package__)
+        cls = globals()[name] = getattr(module, name)
+    return cls
+
 
 class DataAccessFactory:
     """Factory for creating data access components."""
@@ -23,6 +56,37 @@ class DataAccessFactory:
         self._daos = {}
         self._data_sources = {}
 
+        # Guards cache misses so concurrent callers never build duplicate
+        # clients (and connection pools); re-entrant because building a DAO
+        # or data source gets its client through the same path
+        self._lock = threading.RLock()
+
+    def _get_or_create(
+        self, cache: Dict[str, Any], key: str, create: Callable[[], T]
+    ) -> T:
+        """Get a cached component, creating it at most once.
+
+        Args:
+            cache: Cache to look the component up in
+            key: Cache key
+            create: Builds the component on a cache miss
+
+        Returns:
+            T: Cached or newly created component
+        """
+        # Fast path without taking the lock
+        component = cache.get(key)
+        if component is not None:
+            return component
+
+        with self._lock:
+            # Another caller may have created it while we waited
+            component = cache.get(key)
+            if component is None:
+                component = create()
+                cache[key] = component
+            return component
+
     def get_opensearch_client(
         self,
         name: str = "default",
@@ -30,7 +94,7 @@ class DataAccessFactory:
         username: Optional[str] = None,
         password: Optional[str] = None,
         aws_region: Optional[str] = None,
-    ) -> OpenSearchClient:
+    ) -> "OpenSearchClient":
         """Get an OpenSearch client.
 
         Args:
@@ -43,36 +107,35 @@ class DataAccessFactory:
         Returns:
             OpenSearchClient: OpenSearch client
         """
-        if name in self._clients:
-            return self._clients[name]
 
-        # Get configuration from environment variables if not provided
-        if hosts is None:
-            hosts_str = os.environ.get("OPENSEARCH_HOSTS", "http://localhost:9200")
-            hosts = hosts_str.split(",")
+        def create() -> "OpenSearchClient":
+            nonlocal hosts, username, password, aws_region
+
+            # Get configuration from environment variables if not provided
+            if hosts is None:
+                hosts_str = os.environ.get("OPENSEARCH_HOSTS", "http://localhost:9200")
+                hosts = hosts_str.split(",")
 
-        if username is None:
-            username = os.environ.get("OPENSEARCH_USERNAME")
+            if username is None:
+                username = os.environ.get("OPENSEARCH_USERNAME")
 
-        if password is None:
-            password = os.environ.get("OPENSEARCH_PASSWORD")
+            if password is None:
+                password = os.environ.get("OPENSEARCH_PASSWORD")
 
-        if aws_region is None:
-            aws_region = os.environ.get("AWS_REGION")
+            if aws_region is None:
+                aws_region = os.environ.get("AWS_REGION")
 
-        # Create client
-        client = OpenSearchClient(
-            hosts=hosts, username=username, password=password, aws_region=aws_region
-        )
+            return _component("OpenSearchClient")(
+                hosts=hosts, username=username, password=password, aws_region=aws_region
+            )
 
-        self._clients[name] = client
-        return client
+        return self._get_or_create(self._clients, name, create)
 
     def get_regulatory_dao(
         self,
         client_name: str = "default",
         index_prefix: str = "regulatory",
-    ) -> RegulatoryDAO:
+    ) -> "RegulatoryDAO":
         """Get a regulatory DAO.
 
         Args:
@@ -84,23 +147,19 @@ class DataAccessFactory:
         """
         dao_key = f"regulatory_{client_name}_{index_prefix}"
 
-        if dao_key in self._daos:
-            return self._daos[dao_key]
-
-        # Get or create client
-        client = self.get_opensearch_client(client_name)
-
-        # Create DAO
-        dao = RegulatoryDAO(opensearch_client=client, index_prefix=index_prefix)
+        def create() -> "RegulatoryDAO":
+            client = self.get_opensearch_client(client_name)
+            return _component("RegulatoryDAO")(
+                opensearch_client=client, index_prefix=index_prefix
+            )
 
-        self._daos[dao_key] = dao
-        return dao
+        return self._get_or_create(self._daos, dao_key, create)
 
     def get_regulatory_data_source(
         self,
         client_name: str = "default",
         index_prefix: str = "regulatory",
-    ) -> RegulatoryDataSource:
+    ) -> "RegulatoryDataSource":
         """Get a regulatory data source.
 
         Args:
@@ -112,17 +171,13 @@ class DataAccessFactory:
         """
         source_key = f"regulatory_{client_name}_{index_prefix}"
 
-        if source_key in self._data_sources:
-            return self._data_sources[source_key]
+        def create() -> "RegulatoryDataSource":
+            client = self.get_opensearch_client(client_name)
+            return _component("RegulatoryDataSource")(
+                client=client, index_prefix=index_prefix
+            )
 
-        # Get or create client
-        client = self.get_opensearch_client(client_name)
-
-        # Create data source
-        data_source = RegulatoryDataSource(client=client, index_prefix=index_prefix)
-
-        self._data_sources[source_key] = data_source
-        return data_source
+        return self._get_or_create(self._data_sources, source_key, create)
 
     async def close_all_clients(self):
         """Close all OpenSearch clients."""
@@ -130,9 +185,10 @@ class DataAccessFactory:
             logger.info(f"Closing OpenSearch client: {name}")
             await client.close()
 
-        self._clients = {}
-        self._daos = {}
-        self._data_sources = {}
+        with self._lock:
+            self._clients = {}
+            self._daos = {}
+            self._data_sources = {}
 
 
 # Create a singleton instance
@@ -1,18 +1,28 @@
 """OpenSearch client for interacting with OpenSearch/Elasticsearch."""
 import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
-from opensearchpy import AsyncOpenSearch, NotFoundError, OpenSearchException
+from opensearchpy import (AsyncOpenSearch, JSONSerializer, NotFoundError,
+                          OpenSearchException, SerializationError)
 from opensearchpy.helpers import async_bulk
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Default bulk request sizing
+DEFAULT_BULK_CHUNK_SIZE = 500
+DEFAULT_BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+
 
 @dataclass
 class SearchResult(Generic[T]):
@@ -24,6 +34,41 @@ class SearchResult(Generic[T]):
     took_ms: Optional[int] = None
 
 
+@dataclass
+class BulkResult:
+    """Aggregated outcome of a bulk indexing run."""
+
+    success_count: int = 0
+    error_count: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson.
+
+    Falls back to ``JSONSerializer.default`` for types orjson does not
+    handle natively (e.g. ``Decimal``).
+    """
+
+    def loads(self, s):
+        """Deserialize a JSON response body."""
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        """Serialize a request body to a JSON string."""
+        # Pre-serialized bodies (e.g. NDJSON) are passed through untouched,
+        # as JSONSerializer does
+        if isinstance(data, (str, bytes)):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default).decode("utf-8")
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e)
+
+
 class OpenSearchClient:
     """Abstract client for OpenSearch operations."""
 
@@ -38,6 +83,8 @@ class OpenSearchClient:
         connection_timeout: int = 10,
         max_retries: int = 3,
         retry_on_timeout: bool = True,
+        pool_maxsize: int = 32,
+        http_compress: bool = True,
     ):
         """Initialize OpenSearch client.
 
@@ -51,6 +98,8 @@ class OpenSearchClient:
             connection_timeout: Connection timeout in seconds
             max_retries: Maximum number of retries
             retry_on_timeout: Whether to retry on timeout
+            pool_maxsize: Maximum number of pooled connections per host
+            http_compress: Whether to gzip request bodies (e.g. bulk payloads)
         """
         self.hosts = hosts
         self.client_args = {
@@ -60,8 +109,17 @@ class OpenSearchClient:
             "connection_timeout": connection_timeout,
             "max_retries": max_retries,
             "retry_on_timeout": retry_on_timeout,
+            # Async connections size their pool with `maxsize`, sync
+            # (urllib3) connections with `pool_maxsize`
+            "maxsize": pool_maxsize,
+            "pool_maxsize": pool_maxsize,
+            "http_compress": http_compress,
         }
 
+        # Serialize request/response bodies with orjson when available
+        if orjson is not None:
+            self.client_args["serializer"] = OrjsonSerializer()
+
         # Configure authentication
         if username and password:
             self.client_args["http_auth"] = (username, password)
@@ -223,6 +281,8 @@ class OpenSearchClient:
         documents: List[Dict[str, Any]],
         id_field: str = "id",
         refresh: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
     ) -> Dict[str, Any]:
         """Bulk index documents.
 
@@ -231,6 +291,45 @@ class OpenSearchClient:
             documents: List of documents to index
             id_field: Field to use as document ID
             refresh: Whether to refresh the index
+            chunk_size: Number of documents per bulk request
+            max_chunk_bytes: Maximum size of a bulk request in bytes
+
+        Returns:
+            Dict[str, Any]: Bulk indexing response
+        """
+        actions = [
+            {"_index": index, "_id": doc.get(id_field), "_source": doc}
+            for doc in documents
+        ]
+
+        return await self.bulk_index_documents(
+            actions,
+            refresh=refresh,
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+        )
+
+    async def bulk_index_documents(
+        self,
+        actions: List[Dict[str, Any]],
+        refresh: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+    ) -> Dict[str, Any]:
+        """Bulk index prepared bulk actions.
+
+        Each action carries its own ``_index``, so one call can write to
+        several indices. A ``_source`` may be a dict or a pre-serialized JSON
+        string, which is sent as is. Documents rejected with HTTP 429 are
+        retried up to ``max_retries`` times with exponential backoff.
+
+        Args:
+            actions: Bulk actions (``_op_type``, ``_index``, ``_id``, ``_source``)
+            refresh: Whether to refresh the affected indices
+            chunk_size: Number of documents per bulk request
+            max_chunk_bytes: Maximum size of a bulk request in bytes
+            max_retries: Maximum retries for documents rejected with 429
 
         Returns:
             Dict[str, Any]: Bulk indexing response
@@ -238,13 +337,14 @@ class OpenSearchClient:
         try:
             client = await self._get_client()
 
-            actions = [
-                {"_index": index, "_id": doc.get(id_field), "_source": doc}
-                for doc in documents
-            ]
-
             success, errors = await async_bulk(
-                client=client, actions=actions, refresh=refresh, raise_on_error=False
+                client=client,
+                actions=actions,
+                refresh=refresh,
+                raise_on_error=False,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                max_retries=max_retries,
             )
 
             return {
@@ -256,6 +356,104 @@ class OpenSearchClient:
             logger.error(f"Failed to bulk index documents in OpenSearch: {str(e)}")
             raise
 
+    async def parallel_bulk_index_documents(
+        self,
+        actions: List[Dict[str, Any]],
+        thread_count: int = 4,
+        queue_size: int = 4,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        refresh: bool = False,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+    ) -> BulkResult:
+        """Bulk index prepared bulk actions over several concurrent requests.
+
+        Mirrors ``opensearchpy.helpers.parallel_bulk`` on the async client:
+        actions are split into chunks of ``chunk_size`` and fed through a
+        queue of at most ``queue_size`` chunks to ``thread_count`` workers,
+        each sending one bulk request at a time. If a request fails, no
+        further chunks are sent and the first error is raised once the
+        in-flight requests have finished.
+
+        Chunk size and concurrency interact: larger chunks amortize
+        per-request overhead but raise latency and memory pressure on the
+        cluster, while more concurrent requests increase throughput only
+        until the cluster starts rejecting them with HTTP 429. Throughput
+        usually peaks at an interior chunk size, so tune both together
+        against the target cluster.
+
+        Args:
+            actions: Bulk actions (``_op_type``, ``_index``, ``_id``, ``_source``)
+            thread_count: Number of bulk requests in flight
+            queue_size: Maximum number of chunks waiting for a worker
+            chunk_size: Number of documents per bulk request
+            refresh: Whether to refresh the affected indices
+            max_chunk_bytes: Maximum size of a bulk request in bytes
+            max_retries: Maximum retries for documents rejected with 429
+
+        Returns:
+            BulkResult: Aggregated bulk indexing result
+
+        Raises:
+            ValueError: If ``thread_count`` or ``queue_size`` is less than 1
+        """
+        # Without workers, or with an unbounded queue, the producer could
+        # never hand off its chunks
+        if thread_count < 1:
+            raise ValueError(f"thread_count must be at least 1, got {thread_count}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+
+        try:
+            client = await self._get_client()
+            queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+            result = BulkResult()
+            failures: List[Exception] = []
+
+            async def worker():
+                while (chunk := await queue.get()) is not None:
+                    # Once a request has failed, keep draining the queue
+                    # without sending so the producer never blocks on it
+                    if failures:
+                        continue
+                    try:
+                        success, errors = await async_bulk(
+                            client=client,
+                            actions=chunk,
+                            refresh=refresh,
+                            raise_on_error=False,
+                            chunk_size=chunk_size,
+                            max_chunk_bytes=max_chunk_bytes,
+                            max_retries=max_retries,
+                        )
+                    except Exception as e:
+                        failures.append(e)
+                        continue
+                    result.success_count += success
+                    result.error_count += len(errors)
+                    result.errors.extend(errors)
+
+            workers = [asyncio.create_task(worker()) for _ in range(thread_count)]
+            try:
+                for i in range(0, len(actions), chunk_size):
+                    if failures:
+                        break
+                    await queue.put(actions[i : i + chunk_size])
+                # One sentinel per worker
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+
+            if failures:
+                raise failures[0]
+            return result
+        except OpenSearchException as e:
+            logger.error(f"Failed to bulk index documents in OpenSearch: {str(e)}")
+            raise
+
     async def delete_document(
         self,
         index: str,
@@ -1,18 +1,100 @@
 """Regulatory data source implementation."""
+import asyncio
+import json
 import logging
-from dataclasses import asdict, dataclass, field
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from ..clients.opensearch_client import OpenSearchClient
-from ..dao.regulatory_dao import RegulatoryDataType, RegulatoryJurisdiction
+from ..clients.opensearch_client import (DEFAULT_BULK_CHUNK_SIZE, BulkResult,
+                                         OpenSearchClient)
+from ..dao.regulatory_dao import (_DATATYPE_BY_VALUE, _JURISDICTION_BY_VALUE,
+                                  _MULTI_MATCH_FIELDS, RegulatoryDataType,
+                                  RegulatoryJurisdiction)
 from .data_source import OpenSearchDataSource
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _parse_date(value: Any) -> Union[datetime, str, None]:
+    """Parse an ISO format date, leaving other values unchanged."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _multi_match(text: str) -> Dict[str, Any]:
+    """Build a multi_match clause over the boosted text fields."""
+    return {"multi_match": {"query": text, "fields": _MULTI_MATCH_FIELDS}}
+
+
+def _term(field_name: str) -> Callable[[Any], Dict[str, Any]]:
+    """Build a term filter factory for a field, unwrapping enum values."""
+
+    def build(value: Any) -> Dict[str, Any]:
+        return {"term": {field_name: getattr(value, "value", value)}}
+
+    return build
+
+
+_data_type_term = _term("data_type")
+_jurisdiction_term = _term("jurisdiction")
+
+
+class _TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after insertion.
+
+    When full, the oldest entry is evicted first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store an entry, evicting the oldest one when full."""
+        self._data.pop(key, None)
+        while len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@dataclass(slots=True)
 class RegulatoryDocument:
     """Regulatory document model."""
 
@@ -37,58 +119,129 @@ class RegulatoryDocument:
     updated_at: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        doc_dict = asdict(self)
+        """Convert to dictionary.
+
+        Lists and metadata are shared with the document rather than copied,
+        since the result is serialized straight away.
+        """
+        effective_date = self.effective_date
+        publication_date = self.publication_date
+        expiration_date = self.expiration_date
+        created_at = self.created_at
+        updated_at = self.updated_at
+
+        return {
+            "id": self.id,
+            "title": self.title,
+            "data_type": self.data_type.value,
+            "jurisdiction": self.jurisdiction.value,
+            "summary": self.summary,
+            "content": self.content,
+            "effective_date": effective_date.isoformat() if effective_date else None,
+            "publication_date": (
+                publication_date.isoformat() if publication_date else None
+            ),
+            "expiration_date": (
+                expiration_date.isoformat() if expiration_date else None
+            ),
+            "issuing_body": self.issuing_body,
+            "citation": self.citation,
+            "url": self.url,
+            "industries": self.industries,
+            "topics": self.topics,
+            "keywords": self.keywords,
+            "related_documents": self.related_documents,
+            "metadata": self.metadata,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
+        }
 
-        # Convert enum values to strings
-        if isinstance(doc_dict["data_type"], RegulatoryDataType):
-            doc_dict["data_type"] = doc_dict["data_type"].value
+    def to_json_bytes(self, **overrides: Any) -> bytes:
+        """Serialize to JSON bytes in the OpenSearch wire format.
 
-        if isinstance(doc_dict["jurisdiction"], RegulatoryJurisdiction):
-            doc_dict["jurisdiction"] = doc_dict["jurisdiction"].value
+        Produces the same document as ``to_dict``. When orjson is available
+        enums and datetimes are encoded natively, skipping the intermediate
+        converted dict.
 
-        # Convert datetime objects to ISO format strings
-        for date_field in [
-            "effective_date",
-            "publication_date",
-            "expiration_date",
-            "created_at",
-            "updated_at",
-        ]:
-            if doc_dict[date_field] is not None:
-                doc_dict[date_field] = doc_dict[date_field].isoformat()
+        Args:
+            **overrides: Field values to replace in the output
 
-        return doc_dict
+        Returns:
+            bytes: JSON encoded document
+        """
+        if orjson is None:
+            doc_dict = self.to_dict()
+        else:
+            doc_dict = {name: getattr(self, name) for name in _FIELD_NAMES}
+        doc_dict.update(overrides)
+        return _dumps(doc_dict)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RegulatoryDocument":
-        """Create from dictionary."""
-        # Create a copy to avoid modifying the input
-        doc_dict = data.copy()
-
-        # Convert string values to enums
-        if "data_type" in doc_dict and isinstance(doc_dict["data_type"], str):
-            doc_dict["data_type"] = RegulatoryDataType(doc_dict["data_type"])
-
-        if "jurisdiction" in doc_dict and isinstance(doc_dict["jurisdiction"], str):
-            doc_dict["jurisdiction"] = RegulatoryJurisdiction(doc_dict["jurisdiction"])
-
-        # Convert ISO format strings to datetime objects
-        for date_field in [
-            "effective_date",
-            "publication_date",
-            "expiration_date",
-            "created_at",
-            "updated_at",
-        ]:
-            if doc_dict.get(date_field) and isinstance(doc_dict[date_field], str):
-                try:
-                    doc_dict[date_field] = datetime.fromisoformat(doc_dict[date_field])
-                except ValueError:
-                    # If the format isn't ISO, skip conversion
-                    pass
-
-        return cls(**doc_dict)
+        """Create from dictionary.
+
+        Bypasses ``__init__`` and assigns the slots directly, as this runs
+        once per search hit. Dates and containers are only converted when
+        present, so fields missing from search projections just get their
+        defaults. Lists and metadata are copied, so a document never shares
+        them with the source dict.
+        """
+        _get = data.get
+        try:
+            # str enums also match their own members
+            data_type = _DATATYPE_BY_VALUE[data["data_type"]]
+            jurisdiction = _JURISDICTION_BY_VALUE[data["jurisdiction"]]
+        except KeyError:
+            # Fall back to the enum constructors, e.g. for aliases
+            data_type = RegulatoryDataType(data["data_type"])
+            jurisdiction = RegulatoryJurisdiction(data["jurisdiction"])
+
+        doc = object.__new__(cls)
+        doc.id = data["id"]
+        doc.title = data["title"]
+        doc.data_type = data_type
+        doc.jurisdiction = jurisdiction
+        doc.summary = _get("summary")
+        doc.content = _get("content")
+        doc.issuing_body = _get("issuing_body")
+        doc.citation = _get("citation")
+        doc.url = _get("url")
+
+        value = _get("effective_date")
+        doc.effective_date = _parse_date(value) if value else value
+        value = _get("publication_date")
+        doc.publication_date = _parse_date(value) if value else value
+        value = _get("expiration_date")
+        doc.expiration_date = _parse_date(value) if value else value
+        value = _get("created_at")
+        doc.created_at = _parse_date(value) if value else value
+        value = _get("updated_at")
+        doc.updated_at = _parse_date(value) if value else value
+
+        value = _get("industries")
+        doc.industries = list(value) if value else []
+        value = _get("topics")
+        doc.topics = list(value) if value else []
+        value = _get("keywords")
+        doc.keywords = list(value) if value else []
+        value = _get("related_documents")
+        doc.related_documents = list(value) if value else []
+        value = _get("metadata")
+        doc.metadata = dict(value) if value else {}
+        return doc
+
+    @classmethod
+    def from_dicts(cls, data: List[Dict[str, Any]]) -> List["RegulatoryDocument"]:
+        """Create a list of documents from dictionaries.
+
+        Batch counterpart of ``from_dict`` used when hydrating large result
+        sets.
+        """
+        from_dict = cls.from_dict
+        return [from_dict(record) for record in data]
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(RegulatoryDocument))
 
 
 class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
@@ -98,16 +251,32 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         self,
         client: OpenSearchClient,
         index_prefix: str = "regulatory",
+        query_cache_size: int = 1024,
+        query_cache_ttl: float = 60.0,
     ):
         """Initialize the data source.
 
         Args:
             client: OpenSearch client
             index_prefix: Prefix for regulatory indices
+            query_cache_size: Maximum number of cached query results
+            query_cache_ttl: Seconds a cached query result stays valid
         """
-        super().__init__(client, f"{index_prefix}_*")
+        super().__init__(client, sys.intern(f"{index_prefix}_*"))
         self.index_prefix = index_prefix
 
+        # Results of repeated read queries, with one lock per in-flight query
+        # so concurrent identical queries hit OpenSearch once. Writes through
+        # this data source drop every entry and bump the generation
+        self._query_cache = _TTLCache(query_cache_size, query_cache_ttl)
+        self._query_locks: Dict[str, asyncio.Lock] = {}
+        self._query_generation = 0
+
+        # Index names are fixed per data type, so build (and intern) them once
+        self._index_by_type = {
+            dt: sys.intern(f"{index_prefix}_{dt.value}") for dt in RegulatoryDataType
+        }
+
     def _get_index(self, data_type: Optional[RegulatoryDataType] = None) -> str:
         """Get index name for data type.
 
@@ -118,9 +287,69 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
             str: Index name
         """
         if data_type:
-            return f"{self.index_prefix}_{data_type.value}"
+            return self._index_by_type[data_type]
         return self.index
 
+    async def _cached_search(
+        self,
+        index: str,
+        query: Dict[str, Any],
+        use_cache: bool = True,
+        **kwargs,
+    ) -> List[RegulatoryDocument]:
+        """Run a search against an index, caching the hits.
+
+        The cache holds the raw source dicts and every call hydrates fresh
+        documents from them, so callers can mutate their results freely.
+
+        Args:
+            index: Index to search
+            query: Query DSL
+            use_cache: Whether to read and populate the query cache
+            **kwargs: Additional search parameters (page, size, sort)
+
+        Returns:
+            List[RegulatoryDocument]: Matching documents
+        """
+        if not use_cache:
+            hits = await self._search_index(index, query, **kwargs)
+            return await self._hydrate(hits)
+
+        key = json.dumps([index, query, kwargs], sort_keys=True, default=str)
+        hits = self._query_cache.get(key)
+        if hits is None:
+            lock = self._query_locks.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    # Another caller may have filled the entry while we waited
+                    hits = self._query_cache.get(key)
+                    if hits is None:
+                        generation = self._query_generation
+                        hits = await self._search_index(index, query, **kwargs)
+                        # Skip results read before a concurrent write
+                        if generation == self._query_generation:
+                            self._query_cache.set(key, hits)
+            finally:
+                # Leave a lock set up by a newer caller in place
+                if not lock.locked() and self._query_locks.get(key) is lock:
+                    del self._query_locks[key]
+
+        return await self._hydrate(hits)
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached query results after a write."""
+        self._query_generation += 1
+        self._query_cache.clear()
+
+    async def _search_index(
+        self, index: str, query: Dict[str, Any], **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Search a specific index and return the raw source dicts."""
+        # Pass the index through rather than swapping self.index, which is
+        # shared with concurrent requests
+        result = await self.search(query, index=index, raw=True, **kwargs)
+        return result.hits
+
     def transform_record(self, record: Dict[str, Any]) -> RegulatoryDocument:
         """Transform record from OpenSearch to RegulatoryDocument.
 
@@ -132,22 +361,64 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         """
         return RegulatoryDocument.from_dict(record)
 
-    def prepare_record(self, document: RegulatoryDocument) -> Dict[str, Any]:
+    def transform_records(
+        self, records: List[Dict[str, Any]]
+    ) -> List[RegulatoryDocument]:
+        """Transform a batch of records from OpenSearch.
+
+        Args:
+            records: Records from OpenSearch
+
+        Returns:
+            List[RegulatoryDocument]: Transformed documents
+        """
+        return RegulatoryDocument.from_dicts(records)
+
+    def prepare_record(
+        self, document: RegulatoryDocument, now: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Prepare document for OpenSearch.
 
         Args:
             document: Document to prepare
+            now: ISO format timestamp to use, computed if not provided
 
         Returns:
             Dict[str, Any]: Prepared document
         """
-        # Set timestamps
-        now = datetime.utcnow()
-        if not document.created_at:
-            document.created_at = now
-        document.updated_at = now
+        doc = document.to_dict()
+
+        # Set timestamps on the prepared copy only, so the caller's document
+        # can be safely reused (e.g. across retries)
+        if now is None:
+            now = datetime.utcnow().isoformat()
+        if doc["created_at"] is None:
+            doc["created_at"] = now
+        doc["updated_at"] = now
+
+        return doc
 
-        return document.to_dict()
+    def serialize_record(
+        self, document: RegulatoryDocument, now: Optional[str] = None
+    ) -> str:
+        """Serialize a document to its OpenSearch JSON source.
+
+        Produces the same document as ``prepare_record`` without building
+        the intermediate dict.
+
+        Args:
+            document: Document to serialize
+            now: ISO format timestamp to use, computed if not provided
+
+        Returns:
+            str: JSON encoded document
+        """
+        if now is None:
+            now = datetime.utcnow().isoformat()
+        overrides = {"updated_at": now}
+        if document.created_at is None:
+            overrides["created_at"] = now
+        return document.to_json_bytes(**overrides).decode("utf-8")
 
     async def create(self, record: RegulatoryDocument, **kwargs) -> RegulatoryDocument:
         """Create a regulatory document.
@@ -159,20 +430,116 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         Returns:
             RegulatoryDocument: Created document
         """
-        # Use the specific index for the document's data type
-        data_type = record.data_type
-        index = self._get_index(data_type)
+        # Index directly into the data type's index rather than swapping
+        # self.index, which is shared with concurrent requests
+        try:
+            response = await self.client.index_document(
+                index=self._get_index(record.data_type),
+                document=self.prepare_record(record),
+                # Key on the document id, as create_many does, so repeated
+                # creates overwrite rather than duplicate; OpenSearch only
+                # generates one when the document has none
+                id=record.id or None,
+                refresh=kwargs.get("refresh", False),
+            )
+        finally:
+            self._invalidate_query_cache()
+
+        # Return the original record with ID updated if needed
+        if "_id" in response:
+            record.id = response["_id"]
 
-        # Replace self.index temporarily
-        original_index = self.index
-        self.index = index
+        return record
+
+    async def create_many(
+        self,
+        records: List[RegulatoryDocument],
+        refresh: bool = False,
+        parallel: bool = False,
+        thread_count: int = 4,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> BulkResult:
+        """Create regulatory documents in bulk.
+
+        Each document is routed to the index for its data type and its
+        source is serialized straight to JSON, skipping the intermediate
+        dict. By default the batch is written with one chunked bulk call;
+        with ``parallel`` it is spread over ``thread_count`` concurrent bulk
+        requests, which suits large backfills. See
+        ``OpenSearchClient.parallel_bulk_index_documents`` for how
+        ``chunk_size`` and ``thread_count`` interact.
 
+        Args:
+            records: Documents to create
+            refresh: Whether to refresh the indices
+            parallel: Whether to use concurrent bulk requests
+            thread_count: Number of bulk requests in flight when parallel
+            chunk_size: Number of documents per bulk request
+
+        Returns:
+            BulkResult: Aggregated bulk indexing result
+        """
+        # One timestamp for the whole batch
+        now = datetime.utcnow().isoformat()
+
+        actions = [
+            {
+                "_op_type": "index",
+                "_index": self._get_index(record.data_type),
+                "_id": record.id,
+                "_source": self.serialize_record(record, now=now),
+            }
+            for record in records
+        ]
+
+        try:
+            if parallel:
+                return await self.client.parallel_bulk_index_documents(
+                    actions,
+                    thread_count=thread_count,
+                    chunk_size=chunk_size,
+                    refresh=refresh,
+                )
+
+            result = await self.client.bulk_index_documents(
+                actions, refresh=refresh, chunk_size=chunk_size
+            )
+            return BulkResult(**result)
+        finally:
+            self._invalidate_query_cache()
+
+    async def update(
+        self, id: str, record: RegulatoryDocument, **kwargs
+    ) -> Optional[RegulatoryDocument]:
+        """Update a regulatory document.
+
+        Args:
+            id: Document ID
+            record: Updated document
+            **kwargs: Additional parameters
+
+        Returns:
+            Optional[RegulatoryDocument]: Updated document if found and updated
+        """
         try:
-            result = await super().create(record, **kwargs)
-            return result
+            return await super().update(id, record, **kwargs)
         finally:
-            # Restore original index
-            self.index = original_index
+            self._invalidate_query_cache()
+
+    async def delete(self, id: str, **kwargs) -> bool:
+        """Delete a regulatory document.
+
+        Args:
+            id: Document ID
+            **kwargs: Additional parameters
+
+        Returns:
+            bool: True if deleted, False otherwise
+        """
+        try:
+            return await super().delete(id, **kwargs)
+        finally:
+            self._invalidate_query_cache()
 
     async def search_by_text(
         self,
@@ -181,6 +548,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         jurisdiction: Optional[RegulatoryJurisdiction] = None,
         page: int = 1,
         size: int = 20,
+        use_cache: bool = True,
     ) -> List[RegulatoryDocument]:
         """Search for regulatory documents by text.
 
@@ -190,6 +558,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
             jurisdiction: Jurisdiction to filter by
             page: Page number
             size: Page size
+            use_cache: Whether to serve repeated queries from the cache
 
         Returns:
             List[RegulatoryDocument]: Matching documents
@@ -197,37 +566,25 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         # Build the query
         query = {
             "bool": {
-                "must": [
-                    {
-                        "multi_match": {
-                            "query": text,
-                            "fields": ["title^3", "summary^2", "content", "keywords^2"],
-                        }
-                    }
-                ],
+                "must": [_multi_match(text)],
                 "filter": [],
             }
         }
 
         # Add filters
         if data_type:
-            query["bool"]["filter"].append({"term": {"data_type": data_type.value}})
+            query["bool"]["filter"].append(_data_type_term(data_type))
 
         if jurisdiction:
-            query["bool"]["filter"].append(
-                {"term": {"jurisdiction": jurisdiction.value}}
-            )
-
-        # Set the index
-        index = self._get_index(data_type)
-        original_index = self.index
-        self.index = index
+            query["bool"]["filter"].append(_jurisdiction_term(jurisdiction))
 
-        try:
-            result = await self.search(query, page=page, size=size)
-            return result.hits
-        finally:
-            self.index = original_index
+        return await self._cached_search(
+            self._get_index(data_type),
+            query,
+            use_cache=use_cache,
+            page=page,
+            size=size,
+        )
 
     async def get_by_jurisdiction(
         self,
@@ -237,6 +594,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         size: int = 20,
         sort_field: str = "effective_date",
         sort_order: str = "desc",
+        use_cache: bool = True,
     ) -> List[RegulatoryDocument]:
         """Get regulatory documents by jurisdiction.
 
@@ -247,30 +605,29 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
             size: Page size
             sort_field: Field to sort by
             sort_order: Sort order
+            use_cache: Whether to serve repeated queries from the cache
 
         Returns:
             List[RegulatoryDocument]: Matching documents
         """
         # Build the query
-        query = {"bool": {"filter": [{"term": {"jurisdiction": jurisdiction.value}}]}}
+        query = {"bool": {"filter": [_jurisdiction_term(jurisdiction)]}}
 
         # Add data type filter if specified
         if data_type:
-            query["bool"]["filter"].append({"term": {"data_type": data_type.value}})
-
-        # Set the index
-        index = self._get_index(data_type)
-        original_index = self.index
-        self.index = index
+            query["bool"]["filter"].append(_data_type_term(data_type))
 
         # Set sorting
         sort = [{sort_field: {"order": sort_order}}]
 
-        try:
-            result = await self.search(query, page=page, size=size, sort=sort)
-            return result.hits
-        finally:
-            self.index = original_index
+        return await self._cached_search(
+            self._get_index(data_type),
+            query,
+            use_cache=use_cache,
+            page=page,
+            size=size,
+            sort=sort,
+        )
 
     async def get_by_effective_date_range(
         self,
@@ -280,6 +637,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         jurisdiction: Optional[RegulatoryJurisdiction] = None,
         page: int = 1,
         size: int = 20,
+        use_cache: bool = True,
     ) -> List[RegulatoryDocument]:
         """Get regulatory documents by effective date range.
 
@@ -290,6 +648,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
             jurisdiction: Jurisdiction to filter by
             page: Page number
             size: Page size
+            use_cache: Whether to serve repeated queries from the cache
 
         Returns:
             List[RegulatoryDocument]: Matching documents
@@ -312,26 +671,22 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
 
         # Add filters
         if data_type:
-            query["bool"]["filter"].append({"term": {"data_type": data_type.value}})
+            query["bool"]["filter"].append(_data_type_term(data_type))
 
         if jurisdiction:
-            query["bool"]["filter"].append(
-                {"term": {"jurisdiction": jurisdiction.value}}
-            )
-
-        # Set the index
-        index = self._get_index(data_type)
-        original_index = self.index
-        self.index = index
+            query["bool"]["filter"].append(_jurisdiction_term(jurisdiction))
 
         # Set sorting
         sort = [{"effective_date": {"order": "desc"}}]
 
-        try:
-            result = await self.search(query, page=page, size=size, sort=sort)
-            return result.hits
-        finally:
-            self.index = original_index
+        return await self._cached_search(
+            self._get_index(data_type),
+            query,
+            use_cache=use_cache,
+            page=page,
+            size=size,
+            sort=sort,
+        )
 
     async def get_by_topics(
         self,
@@ -341,6 +696,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         jurisdiction: Optional[RegulatoryJurisdiction] = None,
         page: int = 1,
         size: int = 20,
+        use_cache: bool = True,
     ) -> List[RegulatoryDocument]:
         """Get regulatory documents by topics.
 
@@ -351,6 +707,7 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
             jurisdiction: Jurisdiction to filter by
             page: Page number
             size: Page size
+            use_cache: Whether to serve repeated queries from the cache
 
         Returns:
             List[RegulatoryDocument]: Matching documents
@@ -361,28 +718,24 @@ class RegulatoryDataSource(OpenSearchDataSource[RegulatoryDocument]):
         # Add topic filter
         if match_all:
             # Must match all topics (AND)
-            for topic in topics:
-                query["bool"]["filter"].append({"term": {"topics": topic}})
+            query["bool"]["filter"].extend(
+                {"term": {"topics": topic}} for topic in topics
+            )
         else:
             # Match any topic (OR)
             query["bool"]["filter"].append({"terms": {"topics": topics}})
 
         # Add other filters
         if data_type:
-            query["bool"]["filter"].append({"term": {"data_type": data_type.value}})
+            query["bool"]["filter"].append(_data_type_term(data_type))
 
         if jurisdiction:
-            query["bool"]["filter"].append(
-                {"term": {"jurisdiction": jurisdiction.value}}
-            )
-
-        # Set the index
-        index = self._get_index(data_type)
-        original_index = self.index
-        self.index = index
-
-        try:
-            result = await self.search(query, page=page, size=size)
-            return result.hits
-        finally:
-            self.index = original_index
+            query["bool"]["filter"].append(_jurisdiction_term(jurisdiction))
+
+        return await self._cached_search(
+            self._get_index(data_type),
+            query,
+            use_cache=use_cache,
+            page=page,
+            size=size,
+        )
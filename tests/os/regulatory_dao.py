@@ -1,5 +1,7 @@
 """Data Access Object for regulatory data."""
+import asyncio
 import logging
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
@@ -11,6 +13,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Boosted fields for full-text search, shared by every query
+_MULTI_MATCH_FIELDS = ("title^3", "summary^2", "content", "keywords^2")
+
 
 class RegulatoryDataType(str, Enum):
     """Types of regulatory data."""
@@ -32,9 +37,17 @@ class RegulatoryJurisdiction(str, Enum):
     APAC = "apac"
 
 
+# Enum members keyed by value, built once for hot deserialization paths
+_DATATYPE_BY_VALUE = {m.value: m for m in RegulatoryDataType}
+_JURISDICTION_BY_VALUE = {m.value: m for m in RegulatoryJurisdiction}
+
+
 class RegulatoryDAO:
     """Data Access Object for regulatory data."""
 
+    # Data types probed when looking up a regulation without a known type
+    _DATA_TYPES = tuple(RegulatoryDataType)
+
     def __init__(
         self,
         opensearch_client: OpenSearchClient,
@@ -49,6 +62,12 @@ class RegulatoryDAO:
         self.client = opensearch_client
         self.index_prefix = index_prefix
 
+        # Index names are fixed per data type, so build (and intern) them once
+        self._index_by_type = {
+            dt: sys.intern(f"{index_prefix}_{dt.value}") for dt in RegulatoryDataType
+        }
+        self._wildcard_index = sys.intern(f"{index_prefix}_*")
+
     def _get_index_name(self, data_type: Optional[RegulatoryDataType] = None) -> str:
         """Get the index name for the specified data type.
 
@@ -59,8 +78,8 @@ class RegulatoryDAO:
             str: Index name
         """
         if data_type:
-            return f"{self.index_prefix}_{data_type.value}"
-        return f"{self.index_prefix}_*"
+            return self._index_by_type[data_type]
+        return self._wildcard_index
 
     async def search_regulations(
         self,
@@ -102,12 +121,7 @@ class RegulatoryDAO:
         # Full-text search
         if query_text:
             query["bool"]["must"].append(
-                {
-                    "multi_match": {
-                        "query": query_text,
-                        "fields": ["title^3", "summary^2", "content", "keywords^2"],
-                    }
-                }
+                {"multi_match": {"query": query_text, "fields": _MULTI_MATCH_FIELDS}}
             )
 
         # Data type filter
@@ -231,10 +245,14 @@ class RegulatoryDAO:
 
         # If no data_type or document not found, try all indices
         if not data_type:
-            # Try each data type
-            for dt in RegulatoryDataType:
-                index = self._get_index_name(dt)
-                document = await self.client.get_document(index, regulation_id)
+            # Probe every data type index concurrently
+            documents = await asyncio.gather(
+                *(
+                    self.client.get_document(self._get_index_name(dt), regulation_id)
+                    for dt in self._DATA_TYPES
+                )
+            )
+            for document in documents:
                 if document:
                     return document
 
@@ -1,67 +1,23 @@
 """Tests for the OpenSearch client."""
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from opensearchpy import AsyncOpenSearch, NotFoundError, OpenSearchException
-from src.data_access.clients.opensearch_client import (OpenSearchClient,
+from opensearchpy import (JSONSerializer, NotFoundError, OpenSearchException,
+                          SerializationError)
+from src.data_access.clients.opensearch_client import (DEFAULT_BULK_CHUNK_SIZE,
+                                                       BulkResult,
+                                                       OpenSearchClient,
+                                                       OrjsonSerializer,
                                                        SearchResult)
 
 
-@pytest.fixture
-def mock_opensearch():
-    """Mock AsyncOpenSearch client."""
-    mock = AsyncMock(spec=AsyncOpenSearch)
-    return mock
-
-
-@pytest.fixture
-def client(mock_opensearch):
-    """Create OpenSearchClient with mocked AsyncOpenSearch."""
-    with patch(
-        "src.data_access.clients.opensearch_client.AsyncOpenSearch",
-        return_value=mock_opensearch,
-    ):
-        client = OpenSearchClient(
-            hosts=["http://localhost:9200"], username="test", password="test123"
-        )
-        client._client = mock_opensearch
-        return client
-
-
-@pytest.mark.asyncio
-async def test_ping(client, mock_opensearch):
-    """Test ping method."""
-    # Set up mock
-    mock_opensearch.ping.return_value = True
-
-    # Call method
-    result = await client.ping()
-
-    # Verify result
-    assert result is True
-    mock_opensearch.ping.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_ping_failure(client, mock_opensearch):
-    """Test ping method failure."""
-    # Set up mock
-    mock_opensearch.ping.side_effect = OpenSearchException("Ping failed")
-
-    # Call method
-    result = await client.ping()
-
-    # Verify result
-    assert result is False
-    mock_opensearch.ping.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_search(client, mock_opensearch):
-    """Test search method."""
-    # Set up mock
-    mock_opensearch.search.return_value = {
+# Mocks never mutate return values, so responses are shared read-only
+SEARCH_RESPONSE = MappingProxyType(
+    {
         "took": 10,
         "hits": {
             "total": {"value": 2, "relation": "eq"},
@@ -86,6 +42,100 @@ async def test_search(client, mock_opensearch):
         },
         "aggregations": {"count": {"value": 2}},
     }
+)
+
+
+class OpenSearchStub:
+    """Lightweight stand-in for AsyncOpenSearch.
+
+    Only exposes the methods the client calls, avoiding the cost of
+    introspecting AsyncOpenSearch for ``AsyncMock(spec=...)``.
+    """
+
+    METHODS = ("ping", "search", "get", "index", "update", "delete", "bulk", "close")
+
+    def __init__(self):
+        for name in self.METHODS:
+            setattr(self, name, AsyncMock())
+
+    def reset_mock(self, **kwargs):
+        """Reset every stubbed method."""
+        for name in self.METHODS:
+            getattr(self, name).reset_mock(**kwargs)
+
+
+class FastAsyncStub:
+    """Async callable returning a fixed result and recording call kwargs.
+
+    Cheaper than ``AsyncMock`` for methods that only need a return value.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.result
+
+
+@pytest.fixture(scope="module")
+def mock_opensearch():
+    """Mock AsyncOpenSearch client, shared by every test in the module."""
+    return OpenSearchStub()
+
+
+@pytest.fixture(scope="module")
+def client(mock_opensearch):
+    """Create OpenSearchClient with mocked AsyncOpenSearch."""
+    # AsyncOpenSearch is only constructed lazily by _get_client, so injecting
+    # the mock is enough
+    client = OpenSearchClient(
+        hosts=["http://localhost:9200"], username="test", password="test123"
+    )
+    client._client = mock_opensearch
+    # The bulk helpers serialize actions with the transport's serializer
+    mock_opensearch.transport = SimpleNamespace(
+        serializer=client.client_args.get("serializer", JSONSerializer())
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_opensearch(client, mock_opensearch):
+    """Reset the shared mock and client after each test."""
+    yield
+    mock_opensearch.reset_mock(return_value=True, side_effect=True)
+    # close() drops the underlying client
+    client._client = mock_opensearch
+
+
+@pytest.mark.parametrize(
+    "attr, value, expected",
+    [
+        ("return_value", True, True),
+        ("side_effect", OpenSearchException("Ping failed"), False),
+    ],
+    ids=["available", "failure"],
+)
+async def test_ping(client, mock_opensearch, attr, value, expected):
+    """Test ping method."""
+    # Set up mock
+    setattr(mock_opensearch.ping, attr, value)
+
+    # Call method
+    result = await client.ping()
+
+    # Verify result
+    assert result is expected
+    mock_opensearch.ping.assert_called_once()
+
+
+async def test_search(client, mock_opensearch, monkeypatch):
+    """Test search method."""
+    # Set up mock
+    search = FastAsyncStub(SEARCH_RESPONSE)
+    monkeypatch.setattr(mock_opensearch, "search", search)
 
     # Call method
     result = await client.search(
@@ -108,20 +158,21 @@ async def test_search(client, mock_opensearch):
     assert result.aggregations == {"count": {"value": 2}}
 
     # Verify mock was called correctly
-    mock_opensearch.search.assert_called_once_with(
-        index="test-index",
-        body={
-            "query": {"match_all": {}},
-            "sort": [{"title": "asc"}],
-            "aggs": {"count": {"value_count": {"field": "id"}}},
-        },
-        from_=0,  # page 1 starts at 0
-        size=10,
-        _source_includes=["id", "title"],
-    )
+    assert search.calls == [
+        {
+            "index": "test-index",
+            "body": {
+                "query": {"match_all": {}},
+                "sort": [{"title": "asc"}],
+                "aggs": {"count": {"value_count": {"field": "id"}}},
+            },
+            "from_": 0,  # page 1 starts at 0
+            "size": 10,
+            "_source_includes": ["id", "title"],
+        }
+    ]
 
 
-@pytest.mark.asyncio
 async def test_search_exception(client, mock_opensearch):
     """Test search method with exception."""
     # Set up mock
@@ -132,163 +183,327 @@ async def test_search_exception(client, mock_opensearch):
         await client.search(index="test-index", query={"match_all": {}})
 
 
-@pytest.mark.asyncio
-async def test_get_document(client, mock_opensearch):
-    """Test get_document method."""
+# (client method, call kwargs, AsyncOpenSearch method, mock response,
+#  expected result, expected AsyncOpenSearch call kwargs)
+CRUD_CASES = [
+    pytest.param(
+        "get_document",
+        {"index": "test-index", "id": "1", "source_includes": ["id", "title"]},
+        "get",
+        {
+            "_id": "1",
+            "_source": {"id": "1", "title": "Document 1", "content": "Content 1"},
+        },
+        {"id": "1", "title": "Document 1", "content": "Content 1"},
+        {"index": "test-index", "id": "1", "_source_includes": ["id", "title"]},
+        id="get_document",
+    ),
+    pytest.param(
+        "index_document",
+        {
+            "index": "test-index",
+            "document": {"title": "New Document", "content": "New Content"},
+            "id": "new-id",
+            "refresh": True,
+        },
+        "index",
+        {"_id": "new-id", "result": "created"},
+        {"_id": "new-id", "result": "created"},
+        {
+            "index": "test-index",
+            "body": {"title": "New Document", "content": "New Content"},
+            "id": "new-id",
+            "refresh": True,
+        },
+        id="index_document",
+    ),
+    pytest.param(
+        "update_document",
+        {
+            "index": "test-index",
+            "id": "1",
+            "doc": {"title": "Updated Title"},
+            "refresh": True,
+        },
+        "update",
+        {"_id": "1", "result": "updated"},
+        {"_id": "1", "result": "updated"},
+        {
+            "index": "test-index",
+            "id": "1",
+            "body": {"doc": {"title": "Updated Title"}},
+            "refresh": True,
+        },
+        id="update_document",
+    ),
+    pytest.param(
+        "delete_document",
+        {"index": "test-index", "id": "1", "refresh": True},
+        "delete",
+        {"_id": "1", "result": "deleted"},
+        True,
+        {"index": "test-index", "id": "1", "refresh": True},
+        id="delete_document",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "method, kwargs, os_method, response, expected, expected_call", CRUD_CASES
+)
+async def test_document_crud(
+    client,
+    mock_opensearch,
+    monkeypatch,
+    method,
+    kwargs,
+    os_method,
+    response,
+    expected,
+    expected_call,
+):
+    """Test single-document CRUD methods."""
     # Set up mock
-    mock_opensearch.get.return_value = {
-        "_id": "1",
-        "_source": {"id": "1", "title": "Document 1", "content": "Content 1"},
-    }
+    stub = FastAsyncStub(response)
+    monkeypatch.setattr(mock_opensearch, os_method, stub)
 
     # Call method
-    result = await client.get_document(
-        index="test-index", id="1", source_includes=["id", "title"]
-    )
+    result = await getattr(client, method)(**kwargs)
 
     # Verify result
-    assert result["id"] == "1"
-    assert result["title"] == "Document 1"
-    assert result["content"] == "Content 1"
+    assert result == expected
 
     # Verify mock was called correctly
-    mock_opensearch.get.assert_called_once_with(
-        index="test-index", id="1", _source_includes=["id", "title"]
-    )
+    assert stub.calls == [expected_call]
 
 
-@pytest.mark.asyncio
-async def test_get_document_not_found(client, mock_opensearch):
-    """Test get_document method with not found error."""
+@pytest.mark.parametrize(
+    "method, os_method, expected",
+    [("get_document", "get", None), ("delete_document", "delete", False)],
+)
+async def test_document_not_found(client, mock_opensearch, method, os_method, expected):
+    """Test single-document methods with not found error."""
     # Set up mock
-    mock_opensearch.get.side_effect = NotFoundError("Document not found")
+    getattr(mock_opensearch, os_method).side_effect = NotFoundError(
+        "Document not found"
+    )
 
     # Call method
-    result = await client.get_document(index="test-index", id="not-exists")
+    result = await getattr(client, method)(index="test-index", id="not-exists")
 
     # Verify result
-    assert result is None
-
+    assert result is expected
+
+
+def acknowledge_bulk(body, **kwargs):
+    """Build a bulk response acknowledging every index action in a body."""
+    action_lines = body.splitlines()[::2]
+    return {
+        "errors": False,
+        "items": [
+            {"index": {"_id": json.loads(line)["index"]["_id"], "status": 201}}
+            for line in action_lines
+        ],
+    }
 
-@pytest.mark.asyncio
-async def test_index_document(client, mock_opensearch):
-    """Test index_document method."""
-    # Set up mock
-    mock_opensearch.index.return_value = {"_id": "new-id", "result": "created"}
 
-    # Call method
-    document = {"title": "New Document", "content": "New Content"}
-    result = await client.index_document(
-        index="test-index", document=document, id="new-id", refresh=True
-    )
+# (documents, bulk_index kwargs, expected bulk requests)
+BULK_CHUNK_CASES = [
+    pytest.param(2, {}, 1, id="single_chunk"),
+    pytest.param(DEFAULT_BULK_CHUNK_SIZE * 2 + 1, {}, 3, id="default_chunk_size"),
+    pytest.param(10, {"chunk_size": 4}, 3, id="chunk_size"),
+    # Each 71 byte action and source pair fills half of a 150 byte request
+    pytest.param(10, {"max_chunk_bytes": 150}, 5, id="max_chunk_bytes"),
+]
 
-    # Verify result
-    assert result["_id"] == "new-id"
-    assert result["result"] == "created"
 
-    # Verify mock was called correctly
-    mock_opensearch.index.assert_called_once_with(
-        index="test-index", body=document, id="new-id", refresh=True
-    )
-
-
-@pytest.mark.asyncio
-async def test_update_document(client, mock_opensearch):
-    """Test update_document method."""
-    # Set up mock
-    mock_opensearch.update.return_value = {"_id": "1", "result": "updated"}
+@pytest.mark.parametrize("n, kwargs, expected_requests", BULK_CHUNK_CASES)
+async def test_bulk_index(client, mock_opensearch, n, kwargs, expected_requests):
+    """Test bulk_index splits documents into bulk requests."""
+    # Set up mock to acknowledge each request sent by the real bulk helper
+    mock_opensearch.bulk.side_effect = acknowledge_bulk
 
     # Call method
-    doc_update = {"title": "Updated Title"}
-    result = await client.update_document(
-        index="test-index", id="1", doc=doc_update, refresh=True
+    documents = [{"id": str(i), "title": f"Doc {i}"} for i in range(n)]
+    result = await client.bulk_index(
+        index="test-index", documents=documents, id_field="id", refresh=True, **kwargs
     )
 
     # Verify result
-    assert result["_id"] == "1"
-    assert result["result"] == "updated"
+    assert result == {"success_count": n, "error_count": 0, "errors": []}
 
-    # Verify mock was called correctly
-    mock_opensearch.update.assert_called_once_with(
-        index="test-index", id="1", body={"doc": doc_update}, refresh=True
-    )
+    # Verify the documents were split into the expected bulk requests
+    calls = mock_opensearch.bulk.call_args_list
+    assert len(calls) == expected_requests
+    assert all(call.kwargs["refresh"] is True for call in calls)
 
+    # Verify every document was sent once, in order
+    sent = [
+        json.loads(line)
+        for call in calls
+        for line in call.kwargs["body"].splitlines()[1::2]
+    ]
+    assert sent == documents
 
-@pytest.mark.asyncio
-async def test_delete_document(client, mock_opensearch):
-    """Test delete_document method."""
+
+async def test_bulk_index_documents(client, mock_opensearch):
+    """Test bulk_index_documents method."""
     # Set up mock
-    mock_opensearch.delete.return_value = {"_id": "1", "result": "deleted"}
+    with patch("src.data_access.clients.opensearch_client.async_bulk") as mock_bulk:
+        mock_bulk.return_value = (2, [])
 
-    # Call method
-    result = await client.delete_document(index="test-index", id="1", refresh=True)
+        # Call method
+        actions = [
+            {"_op_type": "index", "_index": "index-a", "_id": "1", "_source": {}},
+            {"_op_type": "index", "_index": "index-b", "_id": "2", "_source": {}},
+        ]
+        result = await client.bulk_index_documents(actions, max_retries=5)
 
-    # Verify result
-    assert result is True
+        # Verify result
+        assert result == {"success_count": 2, "error_count": 0, "errors": []}
 
-    # Verify mock was called correctly
-    mock_opensearch.delete.assert_called_once_with(
-        index="test-index", id="1", refresh=True
-    )
+        # Verify mock was called correctly
+        mock_bulk.assert_awaited_once()
+        kwargs = mock_bulk.call_args.kwargs
+        assert kwargs["actions"] == actions
+        assert kwargs["raise_on_error"] is False
+        assert kwargs["max_retries"] == 5
 
 
-@pytest.mark.asyncio
-async def test_delete_document_not_found(client, mock_opensearch):
-    """Test delete_document method with not found error."""
-    # Set up mock
-    mock_opensearch.delete.side_effect = NotFoundError("Document not found")
+async def test_bulk_index_documents_preserialized(client, mock_opensearch):
+    """Test bulk_index_documents sends pre-serialized sources as is."""
+    # Set up mock to acknowledge every action in the bulk body
+    mock_opensearch.bulk.return_value = {
+        "errors": False,
+        "items": [{"index": {"_id": "1", "status": 201}}],
+    }
 
-    # Call method
-    result = await client.delete_document(index="test-index", id="not-exists")
+    # Call method through the real bulk helper and serializer
+    source = '{"id":"1","title":"Doc 1"}'
+    actions = [
+        {"_op_type": "index", "_index": "test-index", "_id": "1", "_source": source}
+    ]
+    result = await client.bulk_index_documents(actions)
 
     # Verify result
-    assert result is False
+    assert result == {"success_count": 1, "error_count": 0, "errors": []}
+
+    # Verify the source line was sent untouched
+    body = mock_opensearch.bulk.call_args.kwargs["body"]
+    action_line, source_line = body.splitlines()
+    assert json.loads(action_line) == {"index": {"_index": "test-index", "_id": "1"}}
+    assert source_line == source
 
 
-@pytest.mark.asyncio
-async def test_bulk_index(client, mock_opensearch):
-    """Test bulk_index method."""
+async def test_parallel_bulk_index_documents(client, mock_opensearch):
+    """Test parallel_bulk_index_documents method."""
     # Set up mock
     with patch("src.data_access.clients.opensearch_client.async_bulk") as mock_bulk:
-        mock_bulk.return_value = (2, [])
+        mock_bulk.side_effect = [(2, []), (2, []), (0, [{"index": {"_id": "5"}}])]
 
         # Call method
-        documents = [{"id": "1", "title": "Doc 1"}, {"id": "2", "title": "Doc 2"}]
-        result = await client.bulk_index(
-            index="test-index", documents=documents, id_field="id", refresh=True
+        actions = [
+            {"_op_type": "index", "_index": "test-index", "_id": str(i), "_source": {}}
+            for i in range(1, 6)
+        ]
+        result = await client.parallel_bulk_index_documents(
+            actions, thread_count=2, queue_size=1, chunk_size=2
         )
 
-        # Verify result
-        assert result["success_count"] == 2
-        assert result["error_count"] == 0
-        assert result["errors"] == []
+        # Verify result aggregates every chunk
+        assert result == BulkResult(
+            success_count=4, error_count=1, errors=[{"index": {"_id": "5"}}]
+        )
 
-        # Verify mock was called correctly
-        expected_actions = [
-            {
-                "_index": "test-index",
-                "_id": "1",
-                "_source": {"id": "1", "title": "Doc 1"},
-            },
-            {
-                "_index": "test-index",
-                "_id": "2",
-                "_source": {"id": "2", "title": "Doc 2"},
-            },
+        # Verify one bulk request per chunk
+        calls = [call.kwargs for call in mock_bulk.call_args_list]
+        assert sorted(
+            [a["_id"] for a in call["actions"]] for call in calls
+        ) == [["1", "2"], ["3", "4"], ["5"]]
+
+
+async def test_parallel_bulk_index_documents_worker_failure(client, mock_opensearch):
+    """Test parallel_bulk_index_documents stops and raises when requests fail."""
+    # Set up mock to fail every request, as when the cluster is down
+    with patch("src.data_access.clients.opensearch_client.async_bulk") as mock_bulk:
+        mock_bulk.side_effect = OpenSearchException("Connection refused")
+
+        # Call method with more chunks than the workers and queue can hold
+        actions = [
+            {"_op_type": "index", "_index": "test-index", "_id": str(i), "_source": {}}
+            for i in range(10)
         ]
-        mock_bulk.assert_called_once()
-        args, kwargs = mock_bulk.call_args
-        assert kwargs["client"] == mock_opensearch
-        assert kwargs["refresh"] is True
-        assert kwargs["raise_on_error"] is False
-        # Check actions list (order might vary)
-        actions = kwargs["actions"]
-        assert len(actions) == 2
-        assert actions[0] in expected_actions
-        assert actions[1] in expected_actions
+        with pytest.raises(OpenSearchException):
+            await asyncio.wait_for(
+                client.parallel_bulk_index_documents(
+                    actions, thread_count=2, queue_size=1, chunk_size=1
+                ),
+                timeout=1,
+            )
+
+        # Verify the remaining chunks were not sent after the failure
+        assert mock_bulk.await_count < len(actions)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"thread_count": 0}, {"queue_size": 0}], ids=["threads", "queue"]
+)
+async def test_parallel_bulk_index_documents_invalid_sizes(
+    client, mock_opensearch, kwargs
+):
+    """Test parallel_bulk_index_documents rejects sizes that would hang."""
+    actions = [{"_index": "test-index", "_id": "1", "_source": {}}]
+
+    with pytest.raises(ValueError):
+        await client.parallel_bulk_index_documents(actions, **kwargs)
+
+    mock_opensearch.bulk.assert_not_called()
+
+
+def test_orjson_serializer():
+    """Test OrjsonSerializer round-trips documents."""
+    pytest.importorskip("orjson")
+    serializer = OrjsonSerializer()
+
+    data = {"id": "1", "effective_date": datetime(2022, 1, 1)}
+    encoded = serializer.dumps(data)
+
+    # Verify result
+    assert isinstance(encoded, str)
+    assert serializer.loads(encoded) == {
+        "id": "1",
+        "effective_date": "2022-01-01T00:00:00",
+    }
+
+    # Pre-serialized bodies pass through unchanged
+    assert serializer.dumps('{"id": "1"}') == '{"id": "1"}'
+    assert serializer.dumps(b'{"id": "1"}\n') == b'{"id": "1"}\n'
+
+    # Unserializable values raise the transport's serialization error
+    with pytest.raises(SerializationError):
+        serializer.dumps({"id": object()})
+    with pytest.raises(SerializationError):
+        serializer.loads("{")
+
+
+async def test_connection_pool_size(mock_opensearch):
+    """Test AsyncOpenSearch is constructed with a large connection pool."""
+    with patch(
+        "src.data_access.clients.opensearch_client.AsyncOpenSearch",
+        return_value=mock_opensearch,
+    ) as mock_cls:
+        client = OpenSearchClient(hosts=["http://localhost:9200"])
+        await client._get_client()
+
+    # The library default of 1-10 connections serializes concurrent requests
+    call_kwargs = mock_cls.call_args.kwargs
+    assert call_kwargs["maxsize"] >= 32
+    assert call_kwargs["pool_maxsize"] >= 32
+
+    # Request bodies are gzipped by default
+    assert call_kwargs["http_compress"] is True
 
 
-@pytest.mark.asyncio
 async def test_close(client, mock_opensearch):
     """Test close method."""
     # Call method
@@ -1,20 +1,57 @@
 """Tests for the RegulatoryDataSource."""
+import asyncio
+import json
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from src.data_access.clients.opensearch_client import SearchResult
+from src.data_access.clients.opensearch_client import BulkResult, SearchResult
 from src.data_access.dao.regulatory_dao import (RegulatoryDataType,
                                                 RegulatoryJurisdiction)
 from src.data_access.sources.regulatory_data_source import (
     RegulatoryDataSource, RegulatoryDocument)
 
 
+class FakeOpenSearchClient:
+    """In-memory fake of OpenSearchClient for data source tests.
+
+    Records every call in ``calls`` as ``(method, args, kwargs)`` and returns
+    the value configured for that method in ``results``.
+    """
+
+    METHODS = (
+        "search",
+        "get_document",
+        "index_document",
+        "update_document",
+        "delete_document",
+        "bulk_index",
+        "bulk_index_documents",
+        "parallel_bulk_index_documents",
+    )
+
+    def __init__(self):
+        self.calls = []
+        self.results = {}
+        for name in self.METHODS:
+            setattr(self, name, self._method(name))
+
+    def _method(self, name):
+        async def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self.results.get(name)
+
+        return method
+
+    def calls_to(self, name):
+        """Get the ``(args, kwargs)`` of every call to a method."""
+        return [(args, kwargs) for method, args, kwargs in self.calls if method == name]
+
+
 @pytest.fixture
 def mock_opensearch_client():
-    """Mock OpenSearch client."""
-    client = AsyncMock()
-    return client
+    """Fake OpenSearch client."""
+    return FakeOpenSearchClient()
 
 
 @pytest.fixture
@@ -63,6 +100,23 @@ def test_regulatory_document_to_dict(sample_document):
     assert doc_dict["topics"] == ["Data Protection", "Privacy"]
 
 
+def test_regulatory_document_to_json_bytes(sample_document):
+    """Test serializing RegulatoryDocument to JSON bytes."""
+    encoded = sample_document.to_json_bytes()
+
+    # Same wire format as to_dict
+    assert json.loads(encoded) == sample_document.to_dict()
+
+    # Overrides replace field values
+    encoded = sample_document.to_json_bytes(updated_at="2023-01-01T00:00:00")
+    assert json.loads(encoded)["updated_at"] == "2023-01-01T00:00:00"
+
+
+def test_regulatory_document_uses_slots(sample_document):
+    """Test RegulatoryDocument instances carry no per-instance __dict__."""
+    assert not hasattr(sample_document, "__dict__")
+
+
 def test_regulatory_document_from_dict():
     """Test creating RegulatoryDocument from dict."""
     doc_dict = {
@@ -97,7 +151,98 @@ def test_regulatory_document_from_dict():
     assert document.topics == ["Data Protection", "Privacy"]
 
 
-@pytest.mark.asyncio
+def test_regulatory_document_from_dict_projection():
+    """Test creating RegulatoryDocument from a partial search projection."""
+    doc_dict = {
+        "id": "test-reg-1",
+        "title": "Test Regulation",
+        "data_type": "regulation",
+        "jurisdiction": "eu",
+        "effective_date": "not a date",
+    }
+
+    document = RegulatoryDocument.from_dict(doc_dict)
+
+    # Non-ISO strings are left unchanged
+    assert document.effective_date == "not a date"
+    assert document.publication_date is None
+
+    # The input is not modified
+    assert doc_dict["data_type"] == "regulation"
+
+
+def test_regulatory_document_from_dict_defaults():
+    """Test from_dict fills defaults and accepts enum members."""
+    doc_dict = {
+        "id": "test-reg-1",
+        "title": "Test Regulation",
+        "data_type": RegulatoryDataType.REGULATION,
+        "jurisdiction": "eu",
+    }
+
+    first = RegulatoryDocument.from_dict(doc_dict)
+    second = RegulatoryDocument.from_dict(doc_dict)
+
+    # Same result as going through __init__
+    assert first == RegulatoryDocument(
+        id="test-reg-1",
+        title="Test Regulation",
+        data_type=RegulatoryDataType.REGULATION,
+        jurisdiction=RegulatoryJurisdiction.EU,
+    )
+
+    # Default lists are not shared between documents
+    assert first.topics is not second.topics
+
+
+def test_regulatory_document_from_dict_copies_containers():
+    """Test from_dict does not share lists or metadata with the source."""
+    doc_dict = {
+        "id": "test-reg-1",
+        "title": "Test Regulation",
+        "data_type": "regulation",
+        "jurisdiction": "eu",
+        "topics": ["Privacy"],
+        "metadata": {"source": "test"},
+        "keywords": None,
+    }
+
+    document = RegulatoryDocument.from_dict(doc_dict)
+    document.topics.append("Mutated")
+    document.metadata["source"] = "mutated"
+
+    assert doc_dict["topics"] == ["Privacy"]
+    assert doc_dict["metadata"] == {"source": "test"}
+    assert document.keywords == []
+
+
+def test_regulatory_document_from_dicts():
+    """Test creating RegulatoryDocuments from a list of dicts."""
+    records = [
+        {
+            "id": "test-reg-1",
+            "title": "Test Regulation",
+            "data_type": "regulation",
+            "jurisdiction": "eu",
+            "effective_date": "2022-01-01T00:00:00",
+        },
+        {
+            "id": "test-std-1",
+            "title": "Test Standard",
+            "data_type": "standard",
+            "jurisdiction": "global",
+        },
+    ]
+
+    documents = RegulatoryDocument.from_dicts(records)
+
+    assert [doc.id for doc in documents] == ["test-reg-1", "test-std-1"]
+    assert documents[0].data_type == RegulatoryDataType.REGULATION
+    assert documents[0].effective_date == datetime(2022, 1, 1)
+    assert documents[1].jurisdiction == RegulatoryJurisdiction.GLOBAL
+    assert documents[1].effective_date is None
+
+
 async def test_transform_record(data_source):
     """Test transform_record method."""
     record = {
@@ -116,29 +261,57 @@ async def test_transform_record(data_source):
     assert result.jurisdiction == RegulatoryJurisdiction.EU
 
 
-@pytest.mark.asyncio
-async def test_prepare_record(data_source, sample_document):
-    """Test prepare_record method."""
-    # Clone the document to avoid modifying the fixture
-    document = RegulatoryDocument(
-        id=sample_document.id,
-        title=sample_document.title,
-        data_type=sample_document.data_type,
-        jurisdiction=sample_document.jurisdiction,
-        summary=sample_document.summary,
-        effective_date=sample_document.effective_date,
-        publication_date=sample_document.publication_date,
+@pytest.mark.parametrize("threshold", [200, 0])
+async def test_search_transforms_hits(data_source, mock_opensearch_client, threshold):
+    """Test search transforms hits inline and in the executor."""
+    data_source.transform_executor_threshold = threshold
+    mock_opensearch_client.results["search"] = SearchResult(
+        hits=[
+            {
+                "id": "test-reg-1",
+                "title": "Test Regulation",
+                "data_type": "regulation",
+                "jurisdiction": "eu",
+            }
+        ],
+        total=1,
+        took_ms=5,
     )
 
+    result = await data_source.search({"match_all": {}})
+
+    assert result.total == 1
+    assert result.took_ms == 5
+    assert isinstance(result.hits[0], RegulatoryDocument)
+    assert result.hits[0].data_type == RegulatoryDataType.REGULATION
+
+
+async def test_search_raw(data_source, mock_opensearch_client):
+    """Test search returns untransformed hits when raw is set."""
+    hit = {
+        "id": "test-reg-1",
+        "title": "Test Regulation",
+        "data_type": "regulation",
+        "jurisdiction": "eu",
+    }
+    mock_opensearch_client.results["search"] = SearchResult(hits=[hit], total=1)
+
+    result = await data_source.search({"match_all": {}}, raw=True)
+
+    assert result.hits == [hit]
+
+
+async def test_prepare_record(data_source, sample_document):
+    """Test prepare_record method."""
     # Ensure timestamps are not set
-    assert document.created_at is None
-    assert document.updated_at is None
+    assert sample_document.created_at is None
+    assert sample_document.updated_at is None
 
-    result = data_source.prepare_record(document)
+    result = data_source.prepare_record(sample_document)
 
-    # Check timestamps were set
-    assert document.created_at is not None
-    assert document.updated_at is not None
+    # Check the input document was not modified
+    assert sample_document.created_at is None
+    assert sample_document.updated_at is None
 
     # Check result is a dict with the right values
     assert isinstance(result, dict)
@@ -147,15 +320,32 @@ async def test_prepare_record(data_source, sample_document):
     assert result["jurisdiction"] == "eu"
 
     # Check timestamps in result
-    assert "created_at" in result
-    assert "updated_at" in result
+    assert result["created_at"] is not None
+    assert result["updated_at"] == result["created_at"]
+
+
+async def test_prepare_record_keeps_created_at(data_source, sample_document):
+    """Test prepare_record preserves an existing created_at."""
+    sample_document.created_at = datetime(2021, 1, 1)
+
+    result = data_source.prepare_record(sample_document)
+
+    assert result["created_at"] == "2021-01-01T00:00:00"
+    assert result["updated_at"] != result["created_at"]
+
+
+async def test_prepare_record_with_timestamp(data_source, sample_document):
+    """Test prepare_record uses a provided timestamp."""
+    result = data_source.prepare_record(sample_document, now="2023-01-01T00:00:00")
+
+    assert result["created_at"] == "2023-01-01T00:00:00"
+    assert result["updated_at"] == "2023-01-01T00:00:00"
 
 
-@pytest.mark.asyncio
 async def test_create(data_source, mock_opensearch_client, sample_document):
     """Test create method."""
     # Set up mock
-    mock_opensearch_client.index_document.return_value = {
+    mock_opensearch_client.results["index_document"] = {
         "_id": sample_document.id,
         "result": "created",
     }
@@ -167,37 +357,99 @@ async def test_create(data_source, mock_opensearch_client, sample_document):
     assert result is sample_document
 
     # Verify mock was called correctly with the right index
-    mock_opensearch_client.index_document.assert_called_once()
-    args, kwargs = mock_opensearch_client.index_document.call_args
+    [(args, kwargs)] = mock_opensearch_client.calls_to("index_document")
 
     assert kwargs["index"] == "test-regulatory_regulation"  # Based on document type
     assert kwargs["document"]["id"] == sample_document.id
     assert kwargs["document"]["title"] == sample_document.title
     assert kwargs["document"]["data_type"] == "regulation"
-    assert kwargs["id"] is None  # Should use the id from the document
+    assert kwargs["id"] == sample_document.id  # Should use the id from the document
+
+
+async def test_create_many(data_source, mock_opensearch_client, sample_document):
+    """Test create_many method."""
+    # Set up mock
+    mock_opensearch_client.results["bulk_index_documents"] = {
+        "success_count": 2,
+        "error_count": 0,
+        "errors": [],
+    }
+    standard = RegulatoryDocument(
+        id="test-std-1",
+        title="Test Standard",
+        data_type=RegulatoryDataType.STANDARD,
+        jurisdiction=RegulatoryJurisdiction.GLOBAL,
+    )
+
+    # Call method
+    result = await data_source.create_many([sample_document, standard])
+
+    # Verify result
+    assert result == BulkResult(success_count=2)
+
+    # Verify a single bulk call received every action
+    [(args, kwargs)] = mock_opensearch_client.calls_to("bulk_index_documents")
+    actions = args[0]
+    assert [(a["_op_type"], a["_index"], a["_id"]) for a in actions] == [
+        ("index", "test-regulatory_regulation", "test-reg-1"),
+        ("index", "test-regulatory_standard", "test-std-1"),
+    ]
+    assert kwargs["refresh"] is False
+
+    # Verify sources are pre-serialized in the OpenSearch wire format
+    source = json.loads(actions[0]["_source"])
+    assert source["data_type"] == "regulation"
+    assert source["effective_date"] == "2022-01-01T00:00:00"
+    assert source["created_at"] is not None
+    assert source["updated_at"] == source["created_at"]
+
+    # Verify the input document was not modified
+    assert sample_document.created_at is None
+
+
+async def test_create_many_parallel(
+    data_source, mock_opensearch_client, sample_document
+):
+    """Test create_many passes thread_count and chunk_size in parallel mode."""
+    # Set up mock
+    mock_opensearch_client.results["parallel_bulk_index_documents"] = BulkResult(
+        success_count=1
+    )
+
+    # Call method
+    result = await data_source.create_many(
+        [sample_document], parallel=True, thread_count=8, chunk_size=100
+    )
+
+    # Verify result
+    assert result.success_count == 1
+
+    # Verify mock was called correctly
+    assert mock_opensearch_client.calls_to("bulk_index_documents") == []
+    [(args, kwargs)] = mock_opensearch_client.calls_to("parallel_bulk_index_documents")
+    assert [action["_id"] for action in args[0]] == ["test-reg-1"]
+    assert kwargs["thread_count"] == 8
+    assert kwargs["chunk_size"] == 100
 
 
-@pytest.mark.asyncio
 async def test_search_by_text(data_source, mock_opensearch_client):
     """Test search_by_text method."""
     # Set up mock
-    mock_result = SearchResult(
-        hits=[
-            RegulatoryDocument(
-                id="doc-1",
-                title="Privacy Regulation",
-                data_type=RegulatoryDataType.REGULATION,
-                jurisdiction=RegulatoryJurisdiction.EU,
-            ),
-            RegulatoryDocument(
-                id="doc-2",
-                title="Data Protection Standard",
-                data_type=RegulatoryDataType.STANDARD,
-                jurisdiction=RegulatoryJurisdiction.GLOBAL,
-            ),
-        ],
-        total=2,
-    )
+    mock_docs = [
+        RegulatoryDocument(
+            id="doc-1",
+            title="Privacy Regulation",
+            data_type=RegulatoryDataType.REGULATION,
+            jurisdiction=RegulatoryJurisdiction.EU,
+        ),
+        RegulatoryDocument(
+            id="doc-2",
+            title="Data Protection Standard",
+            data_type=RegulatoryDataType.STANDARD,
+            jurisdiction=RegulatoryJurisdiction.GLOBAL,
+        ),
+    ]
+    mock_result = SearchResult(hits=[doc.to_dict() for doc in mock_docs], total=2)
 
     # Mock the search method
     with patch.object(data_source, "search", return_value=mock_result) as mock_search:
@@ -209,7 +461,7 @@ async def test_search_by_text(data_source, mock_opensearch_client):
         )
 
         # Verify result
-        assert result == mock_result.hits
+        assert result == mock_docs
 
         # Verify search was called with correct parameters
         mock_search.assert_called_once()
@@ -217,7 +469,7 @@ async def test_search_by_text(data_source, mock_opensearch_client):
 
         query = args[0]
         assert query["bool"]["must"][0]["multi_match"]["query"] == "privacy"
-        assert query["bool"]["must"][0]["multi_match"]["fields"] == [
+        assert list(query["bool"]["must"][0]["multi_match"]["fields"]) == [
             "title^3",
             "summary^2",
             "content",
@@ -234,7 +486,133 @@ async def test_search_by_text(data_source, mock_opensearch_client):
         assert kwargs.get("size") == 20
 
 
-@pytest.mark.asyncio
+async def test_search_by_text_cached(data_source):
+    """Test repeated search_by_text queries are served from the cache."""
+    mock_result = SearchResult(hits=[], total=0)
+
+    with patch.object(data_source, "search", return_value=mock_result) as mock_search:
+        await data_source.search_by_text(text="privacy")
+        await data_source.search_by_text(text="privacy")
+        assert mock_search.call_count == 1
+
+        # Different queries and bypassed lookups still hit OpenSearch
+        await data_source.search_by_text(text="privacy", page=2)
+        await data_source.search_by_text(text="privacy", use_cache=False)
+        assert mock_search.call_count == 3
+
+
+async def test_search_by_text_coalesces_concurrent_queries(data_source):
+    """Test concurrent identical queries share one search."""
+
+    async def slow_search(query, **kwargs):
+        await asyncio.sleep(0.01)
+        return SearchResult(hits=[], total=0)
+
+    with patch.object(data_source, "search", side_effect=slow_search) as mock_search:
+        await asyncio.gather(
+            *(data_source.search_by_text(text="privacy") for _ in range(5))
+        )
+
+    assert mock_search.call_count == 1
+    assert data_source._query_locks == {}
+
+
+async def test_writes_invalidate_query_cache(
+    data_source, mock_opensearch_client, sample_document
+):
+    """Test writes drop cached query results."""
+    mock_opensearch_client.results["index_document"] = {"_id": "test-reg-1"}
+    mock_opensearch_client.results["delete_document"] = True
+    mock_result = SearchResult(hits=[], total=0)
+
+    with patch.object(data_source, "search", return_value=mock_result) as mock_search:
+        await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+        await data_source.create(sample_document)
+        await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+        await data_source.delete("test-reg-1")
+        await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+
+    assert mock_search.call_count == 3
+
+
+async def test_cached_results_are_copies(data_source, sample_document):
+    """Test mutating a returned document does not change cached results."""
+    mock_result = SearchResult(hits=[sample_document.to_dict()], total=1)
+
+    with patch.object(data_source, "search", return_value=mock_result) as mock_search:
+        [first] = await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+        first.topics.append("Mutated")
+        [second] = await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+
+    # The second call was served from the cache as a fresh document
+    assert mock_search.call_count == 1
+    assert mock_search.call_args.kwargs["raw"] is True
+    assert second is not first
+    assert second.topics == ["Data Protection", "Privacy"]
+
+
+async def test_query_lock_kept_for_newer_caller(data_source):
+    """Test a finishing query does not drop a lock a newer caller set up."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_search(query, **kwargs):
+        started.set()
+        await release.wait()
+        return SearchResult(hits=[], total=0)
+
+    with patch.object(data_source, "search", side_effect=slow_search):
+        task = asyncio.create_task(data_source.search_by_text(text="privacy"))
+        await started.wait()
+
+        # Replace the in-flight lock, as a caller arriving after cleanup would
+        [key] = data_source._query_locks
+        newer = data_source._query_locks[key] = asyncio.Lock()
+
+        release.set()
+        await task
+
+    assert data_source._query_locks == {key: newer}
+
+
+async def test_concurrent_searches_keep_index(data_source, mock_opensearch_client):
+    """Test concurrent searches on different indices leave the index unchanged."""
+    searched = []
+
+    async def slow_search(index, **kwargs):
+        await asyncio.sleep(0.01)
+        searched.append(index)
+        return SearchResult(hits=[], total=0)
+
+    mock_opensearch_client.search = slow_search
+
+    await asyncio.gather(
+        data_source.search_by_text("privacy", data_type=RegulatoryDataType.REGULATION),
+        data_source.search_by_text("privacy", data_type=RegulatoryDataType.STANDARD),
+    )
+
+    # Each query hit its own index and the wildcard index was not replaced
+    assert sorted(searched) == [
+        "test-regulatory_regulation",
+        "test-regulatory_standard",
+    ]
+    assert data_source.index == "test-regulatory_*"
+
+
+async def test_query_cache_expires(mock_opensearch_client):
+    """Test cached query results expire after the TTL."""
+    data_source = RegulatoryDataSource(
+        client=mock_opensearch_client, index_prefix="test", query_cache_ttl=0
+    )
+    mock_result = SearchResult(hits=[], total=0)
+
+    with patch.object(data_source, "search", return_value=mock_result) as mock_search:
+        await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+        await data_source.get_by_jurisdiction(RegulatoryJurisdiction.EU)
+
+    assert mock_search.call_count == 2
+
+
 async def test_get_by_jurisdiction(data_source, mock_opensearch_client):
     """Test get_by_jurisdiction method."""
     # Set up mock
@@ -252,7 +630,7 @@ async def test_get_by_jurisdiction(data_source, mock_opensearch_client):
             jurisdiction=RegulatoryJurisdiction.EU,
         ),
     ]
-    mock_result = SearchResult(hits=mock_docs, total=2)
+    mock_result = SearchResult(hits=[doc.to_dict() for doc in mock_docs], total=2)
 
     # Mock the search method
     with patch.object(data_source, "search", return_value=mock_result) as mock_search:
@@ -284,7 +662,6 @@ async def test_get_by_jurisdiction(data_source, mock_opensearch_client):
         assert kwargs["sort"] == [{"title": {"order": "asc"}}]
 
 
-@pytest.mark.asyncio
 async def test_get_by_effective_date_range(data_source, mock_opensearch_client):
     """Test get_by_effective_date_range method."""
     # Set up mock
@@ -304,7 +681,7 @@ async def test_get_by_effective_date_range(data_source, mock_opensearch_client):
             effective_date=datetime(2022, 2, 1),
         ),
     ]
-    mock_result = SearchResult(hits=mock_docs, total=2)
+    mock_result = SearchResult(hits=[doc.to_dict() for doc in mock_docs], total=2)
 
     # Mock the search method
     with patch.object(data_source, "search", return_value=mock_result) as mock_search:
@@ -344,7 +721,6 @@ async def test_get_by_effective_date_range(data_source, mock_opensearch_client):
         assert kwargs["sort"] == [{"effective_date": {"order": "desc"}}]
 
 
-@pytest.mark.asyncio
 async def test_get_by_topics(data_source, mock_opensearch_client):
     """Test get_by_topics method."""
     # Set up mock
@@ -364,7 +740,7 @@ async def test_get_by_topics(data_source, mock_opensearch_client):
             topics=["Security", "Data Protection"],
         ),
     ]
-    mock_result = SearchResult(hits=mock_docs, total=2)
+    mock_result = SearchResult(hits=[doc.to_dict() for doc in mock_docs], total=2)
 
     # Mock the search method
     with patch.object(data_source, "search", return_value=mock_result) as mock_search:
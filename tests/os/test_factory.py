@@ -1,5 +1,7 @@
 """Tests for the DataAccessFactory."""
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -127,6 +129,26 @@ def test_get_opensearch_client_cached(factory):
     assert client is mock_client
 
 
+def test_get_opensearch_client_concurrent(factory):
+    """Test concurrent callers share a single client."""
+
+    def slow_client(**kwargs):
+        time.sleep(0.01)
+        return MagicMock()
+
+    with patch(
+        "src.data_access.factory.OpenSearchClient", side_effect=slow_client
+    ) as mock_client_class:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(lambda _: factory.get_opensearch_client(), range(8))
+            )
+
+    # Only one client was built and every caller got it
+    mock_client_class.assert_called_once()
+    assert all(client is clients[0] for client in clients)
+
+
 def test_get_regulatory_dao(factory):
     """Test get_regulatory_dao method."""
     # Mock OpenSearchClient and RegulatoryDAO
@@ -213,7 +235,6 @@ def test_get_regulatory_data_source_cached(factory):
     assert data_source is mock_data_source
 
 
-@pytest.mark.asyncio
 async def test_close_all_clients(factory):
     """Test close_all_clients method."""
     # Create mock clients
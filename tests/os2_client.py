@@ -11,6 +11,8 @@ class OpenSearchConfig:
     connection_timeout: int = 10
     max_retries: int = 3
     retry_on_timeout: bool = True
+    pool_maxsize: int = 20
+    http_compress: bool = True
 
 
 class OpenSearchClient:
@@ -30,6 +32,11 @@ class OpenSearchClient:
             "connection_timeout": config.connection_timeout,
             "max_retries": config.max_retries,
             "retry_on_timeout": config.retry_on_timeout,
+            # Keep enough pooled connections for concurrent bulk requests and
+            # gzip the (highly compressible) request bodies
+            "pool_maxsize": config.pool_maxsize,
+            "maxsize": config.pool_maxsize,
+            "http_compress": config.http_compress,
         }
 
         # Configure authentication
@@ -1,4 +1,4 @@
-@dataclass
+@dataclass(slots=True)
 class RegulationSearchRequest:
     """Request for searching regulations."""
 
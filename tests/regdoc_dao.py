@@ -1,4 +1,4 @@
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata for regulatory documents."""
 
@@ -10,7 +10,7 @@ class DocumentMetadata:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulatoryDocument:
     """Regulatory document model."""
 
@@ -1,8 +1,7 @@
 """Tests for the API class."""
 import json
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
-import pytest
 from lambda_api.api import API, create_handler
 from lambda_api.context import Context
 from lambda_api.events import Event
@@ -13,7 +12,6 @@ from lambda_api.types import (EventType, HTTPMethod, HTTPStatus,
 from lambda_api.views import ResourceView, View
 
 
-@pytest.mark.asyncio
 async def test_api_initialization():
     """Test API initialization."""
     # Default initialization
@@ -30,7 +28,6 @@ async def test_api_initialization():
     assert api.logger is logger
 
 
-@pytest.mark.asyncio
 async def test_api_middleware():
     """Test API middleware method."""
     api = API()
@@ -51,7 +48,6 @@ async def test_api_middleware():
     assert api.middleware_manager.middlewares[0] is test_middleware
 
 
-@pytest.mark.asyncio
 async def test_api_on():
     """Test API on method."""
     api = API()
@@ -72,7 +68,6 @@ async def test_api_on():
     assert test_handler in api.events.handlers[EventType.REQUEST_RECEIVED]
 
 
-@pytest.mark.asyncio
 async def test_api_routing_methods():
     """Test API routing methods."""
     api = API()
@@ -123,7 +118,6 @@ class TestView(View):
         return {"view": "test"}
 
 
-@pytest.mark.asyncio
 async def test_api_register_view():
     """Test API register_view method."""
     api = API()
@@ -144,8 +138,7 @@ async def test_api_register_view():
     assert response == {"view": "test"}
 
 
-@pytest.mark.asyncio
-async def test_api_dispatch():
+async def test_api_dispatch(async_spy):
     """Test API dispatch method."""
     api = API()
     logger = Mock()
@@ -157,10 +150,10 @@ async def test_api_dispatch():
         return {"success": True}
 
     # Register event handler to verify events are emitted
-    request_received_handler = AsyncMock()
-    before_dispatch_handler = AsyncMock()
-    after_dispatch_handler = AsyncMock()
-    response_ready_handler = AsyncMock()
+    request_received_handler = async_spy()
+    before_dispatch_handler = async_spy()
+    after_dispatch_handler = async_spy()
+    response_ready_handler = async_spy()
 
     api.events.on(EventType.REQUEST_RECEIVED, request_received_handler)
     api.events.on(EventType.BEFORE_DISPATCH, before_dispatch_handler)
@@ -188,7 +181,6 @@ async def test_api_dispatch():
     logger.info.assert_called_with("GET /test")
 
 
-@pytest.mark.asyncio
 async def test_api_dispatch_not_found():
     """Test API dispatch method with non-existent route."""
     api = API()
@@ -205,7 +197,6 @@ async def test_api_dispatch_not_found():
     assert response.status == HTTPStatus.NOT_FOUND
 
 
-@pytest.mark.asyncio
 async def test_api_dispatch_method_not_allowed():
     """Test API dispatch method with method not allowed."""
     api = API()
@@ -228,7 +219,6 @@ async def test_api_dispatch_method_not_allowed():
     assert response.headers["Allow"] == "GET"
 
 
-@pytest.mark.asyncio
 async def test_api_handle_event_http():
     """Test API handle_event method with HTTP event."""
     api = API()
@@ -258,7 +248,6 @@ async def test_api_handle_event_http():
     }
 
 
-@pytest.mark.asyncio
 async def test_api_handle_event_direct():
     """Test API handle_event method with direct invocation."""
     api = API()
@@ -277,7 +266,6 @@ async def test_api_handle_event_direct():
     }
 
 
-@pytest.mark.asyncio
 async def test_api_handle_event_with_middleware():
     """Test API handle_event method with middleware."""
     api = API()
@@ -307,7 +295,6 @@ async def test_api_handle_event_with_middleware():
     assert json.loads(response["body"]) == {"success": True, "middleware_ran": True}
 
 
-@pytest.mark.asyncio
 async def test_create_handler():
     """Test create_handler function."""
     api = API()
@@ -1,7 +1,6 @@
 """Tests for the events module."""
 from unittest.mock import AsyncMock, Mock
 
-import pytest
 from lambda_api.context import Context
 from lambda_api.events import Event, EventEmitter
 from lambda_api.types import EventType
@@ -26,14 +25,12 @@ def test_event_initialization():
     assert event.data == {"error": "Test error"}
 
 
-@pytest.mark.asyncio
 async def test_event_emitter_initialization():
     """Test event emitter initialization."""
     emitter = EventEmitter()
     assert emitter.handlers == {}
 
 
-@pytest.mark.asyncio
 async def test_event_emitter_on():
     """Test event emitter on method."""
     emitter = EventEmitter()
@@ -61,15 +58,14 @@ async def test_event_emitter_on():
     assert handler3 in emitter.handlers[EventType.ERROR]
 
 
-@pytest.mark.asyncio
-async def test_event_emitter_emit():
+async def test_event_emitter_emit(async_spy):
     """Test event emitter emit method."""
     emitter = EventEmitter()
 
-    # Create mock handlers
-    handler1 = AsyncMock()
-    handler2 = AsyncMock()
-    handler3 = AsyncMock()
+    # Create handler spies
+    handler1 = async_spy()
+    handler2 = async_spy()
+    handler3 = async_spy()
 
     # Register handlers
     emitter.on(EventType.REQUEST_RECEIVED, handler1)
@@ -109,7 +105,6 @@ async def test_event_emitter_emit():
     handler3.assert_called_once_with(error_event)
 
 
-@pytest.mark.asyncio
 async def test_event_emitter_emit_no_handlers():
     """Test event emitter emit method with no handlers."""
     emitter = EventEmitter()
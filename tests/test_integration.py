@@ -39,9 +39,8 @@ class UserView(ResourceView):
         )
 
 
-@pytest.fixture
-def api():
-    """Create API instance for testing."""
+def build_api():
+    """Create an API with the routes, middleware and handlers under test."""
     api = API()
 
     # Register function-based routes
@@ -89,172 +88,147 @@ def api():
     return api
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def api():
+    """Create API instance shared by the read-only tests."""
+    return build_api()
+
+
+@pytest.fixture(scope="module")
 def lambda_handler(api):
     """Create Lambda handler from API."""
     return create_handler(api)
 
 
-@pytest.mark.asyncio
-async def test_health_endpoint(lambda_handler):
-    """Test health endpoint."""
-    # Create event
-    event = {"httpMethod": "GET", "path": "/health", "headers": {}}
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 200
-    assert json.loads(response["body"]) == {"status": "healthy"}
-    assert "X-Processing-Time" in response["headers"]
-    assert "X-Response-Logged" in response["headers"]
-
-
-@pytest.mark.asyncio
-async def test_create_user(lambda_handler):
-    """Test create user endpoint."""
-    # Create event
-    event = {
-        "httpMethod": "POST",
-        "path": "/users",
-        "headers": {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer valid-token",
+@pytest.fixture
+def isolated_api():
+    """Create a fresh API instance for tests that register routes."""
+    return build_api()
+
+
+DIRECT_EVENT = {"action": "process", "data": {"id": 123, "items": ["item1", "item2"]}}
+
+# (event, expected status, expected top-level body fields, expected headers)
+ENDPOINT_CASES = [
+    pytest.param(
+        {"httpMethod": "GET", "path": "/health", "headers": {}},
+        200,
+        {"status": "healthy"},
+        {"X-Processing-Time": "0.001s", "X-Response-Logged": "True"},
+        id="health",
+    ),
+    pytest.param(
+        {
+            "httpMethod": "POST",
+            "path": "/users",
+            "headers": {
+                "Content-Type": "application/json",
+                "Authorization": "Bearer valid-token",
+            },
+            "body": json.dumps({"name": "Test User", "email": "test@example.com"}),
         },
-        "body": json.dumps({"name": "Test User", "email": "test@example.com"}),
-    }
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 201
-    body = json.loads(response["body"])
-    assert body["id"] == "new-user"
-    assert body["data"]["name"] == "Test User"
-    assert body["data"]["email"] == "test@example.com"
-
-
-@pytest.mark.asyncio
-async def test_get_user(lambda_handler):
-    """Test get user endpoint."""
-    # Create event
-    event = {
-        "httpMethod": "GET",
-        "path": "/users/123",
-        "headers": {"Authorization": "Bearer valid-token"},
-        "pathParameters": {"user_id": "123"},
-    }
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 200
-    body = json.loads(response["body"])
-    assert body["id"] == "123"
-    assert body["name"] == "User 123"
-    assert body["context_data"]["authenticated"] is True
-
-
-@pytest.mark.asyncio
-async def test_update_user(lambda_handler):
-    """Test update user endpoint."""
-    # Create event
-    event = {
-        "httpMethod": "PUT",
-        "path": "/users/123",
-        "headers": {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer valid-token",
+        201,
+        {
+            "id": "new-user",
+            "data": {"name": "Test User", "email": "test@example.com"},
         },
-        "pathParameters": {"user_id": "123"},
-        "body": json.dumps({"name": "Updated User"}),
-    }
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 200
-    body = json.loads(response["body"])
-    assert body["id"] == "123"
-    assert body["message"] == "User updated"
-    assert body["data"]["name"] == "Updated User"
-
-
-@pytest.mark.asyncio
-async def test_delete_user(lambda_handler):
-    """Test delete user endpoint."""
-    # Create event
-    event = {
-        "httpMethod": "DELETE",
-        "path": "/users/123",
-        "headers": {"Authorization": "Bearer valid-token"},
-        "pathParameters": {"user_id": "123"},
-    }
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 200
-    body = json.loads(response["body"])
-    assert body["message"] == "User 123 deleted"
-
-
-@pytest.mark.asyncio
-async def test_not_found(lambda_handler):
-    """Test not found error."""
-    # Create event
-    event = {"httpMethod": "GET", "path": "/not-found", "headers": {}}
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 404
-    body = json.loads(response["body"])
-    assert body["error"] == "Not found"
-
-
-@pytest.mark.asyncio
-async def test_method_not_allowed(lambda_handler):
-    """Test method not allowed error."""
-    # Create event
-    event = {"httpMethod": "POST", "path": "/health", "headers": {}}
-
-    # Call handler
-    response = await lambda_handler(event, None)
-
-    # Verify response
-    assert response["statusCode"] == 405
-    body = json.loads(response["body"])
-    assert body["error"] == "Method not allowed"
-    assert body["allowed"] == ["GET"]
-    assert response["headers"]["Allow"] == "GET"
-
-
-@pytest.mark.asyncio
-async def test_direct_invocation(lambda_handler):
-    """Test direct invocation (non-HTTP)."""
-    # Create event
-    event = {"action": "process", "data": {"id": 123, "items": ["item1", "item2"]}}
-
+        {},
+        id="create_user",
+    ),
+    pytest.param(
+        {
+            "httpMethod": "GET",
+            "path": "/users/123",
+            "headers": {"Authorization": "Bearer valid-token"},
+            "pathParameters": {"user_id": "123"},
+        },
+        200,
+        {
+            "id": "123",
+            "name": "User 123",
+            "context_data": {"authenticated": True},
+        },
+        {},
+        id="get_user",
+    ),
+    pytest.param(
+        {
+            "httpMethod": "PUT",
+            "path": "/users/123",
+            "headers": {
+                "Content-Type": "application/json",
+                "Authorization": "Bearer valid-token",
+            },
+            "pathParameters": {"user_id": "123"},
+            "body": json.dumps({"name": "Updated User"}),
+        },
+        200,
+        {
+            "id": "123",
+            "message": "User updated",
+            "data": {"name": "Updated User"},
+        },
+        {},
+        id="update_user",
+    ),
+    pytest.param(
+        {
+            "httpMethod": "DELETE",
+            "path": "/users/123",
+            "headers": {"Authorization": "Bearer valid-token"},
+            "pathParameters": {"user_id": "123"},
+        },
+        200,
+        {"message": "User 123 deleted"},
+        {},
+        id="delete_user",
+    ),
+    pytest.param(
+        {"httpMethod": "GET", "path": "/not-found", "headers": {}},
+        404,
+        {"error": "Not found"},
+        {},
+        id="not_found",
+    ),
+    pytest.param(
+        {"httpMethod": "POST", "path": "/health", "headers": {}},
+        405,
+        {"error": "Method not allowed", "allowed": ["GET"]},
+        {"Allow": "GET"},
+        id="method_not_allowed",
+    ),
+    pytest.param(
+        DIRECT_EVENT,
+        200,
+        {"message": "Direct invocation", "event": DIRECT_EVENT},
+        {},
+        id="direct_invocation",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "event,expected_status,expected_body,expected_headers", ENDPOINT_CASES
+)
+async def test_endpoints(
+    lambda_handler, event, expected_status, expected_body, expected_headers
+):
+    """Test each endpoint through the shared Lambda handler."""
     # Call handler
     response = await lambda_handler(event, None)
 
     # Verify response
-    assert response["statusCode"] == 200
+    assert response["statusCode"] == expected_status
     body = json.loads(response["body"])
-    assert body["message"] == "Direct invocation"
-    assert body["event"] == event
+    assert {key: body.get(key) for key in expected_body} == expected_body
+    for name, value in expected_headers.items():
+        assert response["headers"][name] == value
 
 
-@pytest.mark.asyncio
-async def test_error_handling(lambda_handler, api):
+async def test_error_handling(isolated_api):
     """Test error handling."""
+    api = isolated_api
+    lambda_handler = create_handler(api)
 
     # Register route that raises an exception
     @api.get("/error")
@@ -273,9 +247,10 @@ async def test_error_handling(lambda_handler, api):
     assert body["error"] == "Test error"
 
 
-@pytest.mark.asyncio
-async def test_middleware_short_circuit(lambda_handler, api):
+async def test_middleware_short_circuit(isolated_api):
     """Test middleware short-circuiting."""
+    api = isolated_api
+    lambda_handler = create_handler(api)
 
     # Register middleware that short-circuits
     @api.middleware
@@ -303,7 +278,6 @@ async def test_middleware_short_circuit(lambda_handler, api):
     assert body["error"] == "Access denied"
 
 
-@pytest.mark.asyncio
 async def test_path_parameters_from_router(lambda_handler):
     """Test path parameters extracted from router matching."""
     # Create event without pathParameters but with matching path
@@ -1,7 +1,6 @@
 """Tests for the middleware module."""
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import Mock
 
-import pytest
 from lambda_api.context import Context
 from lambda_api.middleware import MiddlewareManager
 from lambda_api.request import Request
@@ -9,18 +8,16 @@ from lambda_api.response import Response
 from lambda_api.types import HTTPMethod
 
 
-@pytest.mark.asyncio
 async def test_middleware_manager_initialization():
     """Test middleware manager initialization."""
     manager = MiddlewareManager()
     assert manager.middlewares == []
 
 
-@pytest.mark.asyncio
-async def test_middleware_manager_add():
+async def test_middleware_manager_add(async_spy):
     """Test middleware manager add method."""
     manager = MiddlewareManager()
-    middleware = AsyncMock()
+    middleware = async_spy()
 
     # Add middleware
     manager.add(middleware)
@@ -29,21 +26,20 @@ async def test_middleware_manager_add():
     assert manager.middlewares[0] is middleware
 
     # Add another middleware
-    middleware2 = AsyncMock()
+    middleware2 = async_spy()
     manager.add(middleware2)
 
     assert len(manager.middlewares) == 2
     assert manager.middlewares[1] is middleware2
 
 
-@pytest.mark.asyncio
-async def test_middleware_manager_execute_no_middleware():
+async def test_middleware_manager_execute_no_middleware(async_spy):
     """Test middleware manager execute method with no middleware."""
     manager = MiddlewareManager()
 
-    # Create mock handler
+    # Create handler spy
     handler_response = Response(body={"message": "Success"})
-    handler = AsyncMock(return_value=handler_response)
+    handler = async_spy(return_value=handler_response)
 
     # Create request and context
     request = Request(method=HTTPMethod.GET, path="/test")
@@ -57,14 +53,13 @@ async def test_middleware_manager_execute_no_middleware():
     assert response is handler_response
 
 
-@pytest.mark.asyncio
-async def test_middleware_manager_execute_single_middleware():
+async def test_middleware_manager_execute_single_middleware(async_spy):
     """Test middleware manager execute method with a single middleware."""
     manager = MiddlewareManager()
 
-    # Create mock handler
+    # Create handler spy
     handler_response = Response(body={"message": "Success"})
-    handler = AsyncMock(return_value=handler_response)
+    handler = async_spy(return_value=handler_response)
 
     # Create middleware that passes through
     async def middleware1(req, ctx, next_mw):
@@ -96,14 +91,13 @@ async def test_middleware_manager_execute_single_middleware():
     assert response.headers["X-Middleware1"] == "True"
 
 
-@pytest.mark.asyncio
-async def test_middleware_manager_execute_multiple_middleware():
+async def test_middleware_manager_execute_multiple_middleware(async_spy):
     """Test middleware manager execute method with multiple middleware."""
     manager = MiddlewareManager()
 
-    # Create mock handler
+    # Create handler spy
     handler_response = Response(body={"message": "Success"})
-    handler = AsyncMock(return_value=handler_response)
+    handler = async_spy(return_value=handler_response)
 
     # Create middlewares
     middleware_calls = []
@@ -160,13 +154,12 @@ async def test_middleware_manager_execute_multiple_middleware():
     ]
 
 
-@pytest.mark.asyncio
-async def test_middleware_manager_execute_short_circuit():
+async def test_middleware_manager_execute_short_circuit(async_spy):
     """Test middleware manager execute method with short-circuiting middleware."""
     manager = MiddlewareManager()
 
-    # Create mock handler that should not be called
-    handler = AsyncMock()
+    # Create handler spy that should not be called
+    handler = async_spy()
 
     # Create middleware that short-circuits
     async def auth_middleware(req, ctx, next_mw):
@@ -81,7 +81,6 @@ def direct_handler(direct_api):
     return create_handler(direct_api)
 
 
-@pytest.mark.asyncio
 async def test_direct_calculate(direct_handler):
     """Test direct invocation with calculate action."""
     # Create event
@@ -97,7 +96,6 @@ async def test_direct_calculate(direct_handler):
     assert body["result"] == 15  # sum of 1+2+3+4+5
 
 
-@pytest.mark.asyncio
 async def test_direct_process(direct_handler):
     """Test direct invocation with process action."""
     # Create event
@@ -115,7 +113,6 @@ async def test_direct_process(direct_handler):
     assert body["result"]["itemCount"] == 3
 
 
-@pytest.mark.asyncio
 async def test_direct_error(direct_handler):
     """Test direct invocation with error action."""
     # Create event
@@ -131,7 +128,6 @@ async def test_direct_error(direct_handler):
     assert body["details"] == "Something went wrong"
 
 
-@pytest.mark.asyncio
 async def test_direct_default(direct_handler):
     """Test direct invocation with default handling."""
     # Create event
@@ -147,7 +143,6 @@ async def test_direct_default(direct_handler):
     assert body["event"] == event
 
 
-@pytest.mark.asyncio
 async def test_http_still_works(direct_handler):
     """Test that HTTP handling still works with custom direct invocation."""
     # Create event
@@ -183,7 +178,6 @@ class CustomContext:
         return 3000  # 3 seconds
 
 
-@pytest.mark.asyncio
 async def test_with_custom_lambda_context(direct_handler):
     """Test direct invocation with custom Lambda context."""
     # Create event and context
@@ -199,7 +193,6 @@ async def test_with_custom_lambda_context(direct_handler):
     assert body["result"] == 60  # sum of 10+20+30
 
 
-@pytest.mark.asyncio
 async def test_complex_nested_data(direct_handler):
     """Test direct invocation with complex nested data."""
     # Create event with complex data
@@ -37,7 +37,6 @@ class TestResourceView(ResourceView):
         return {"id": request.param("id"), "method": "put"}
 
 
-@pytest.mark.asyncio
 async def test_view_dispatch_get():
     """Test view dispatch method with GET request."""
     view = TestView()
@@ -47,7 +46,6 @@ async def test_view_dispatch_get():
     assert result == {"method": "get"}
 
 
-@pytest.mark.asyncio
 async def test_view_dispatch_post():
     """Test view dispatch method with POST request."""
     view = TestView()
@@ -57,7 +55,6 @@ async def test_view_dispatch_post():
     assert result == {"method": "post"}
 
 
-@pytest.mark.asyncio
 async def test_view_dispatch_method_not_allowed():
     """Test view dispatch method with method not allowed."""
     view = TestView()
@@ -71,7 +68,6 @@ async def test_view_dispatch_method_not_allowed():
     assert result.headers["Allow"] == "GET, POST"
 
 
-@pytest.mark.asyncio
 async def test_view_as_view():
     """Test view as_view class method."""
     # Get view function
@@ -92,7 +88,6 @@ async def test_view_as_view():
     assert result == {"method": "post"}
 
 
-@pytest.mark.asyncio
 async def test_resource_view_get():
     """Test resource view get method."""
     view = TestResourceView()
@@ -104,7 +99,6 @@ async def test_resource_view_get():
     assert result == {"id": "123", "method": "get"}
 
 
-@pytest.mark.asyncio
 async def test_resource_view_put():
     """Test resource view put method."""
     view = TestResourceView()
@@ -116,7 +110,6 @@ async def test_resource_view_put():
     assert result == {"id": "123", "method": "put"}
 
 
-@pytest.mark.asyncio
 async def test_resource_view_method_not_implemented():
     """Test resource view method not implemented."""
     view = TestResourceView()
@@ -130,7 +123,6 @@ async def test_resource_view_method_not_implemented():
     assert "Method DELETE not implemented" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_resource_view_as_view():
     """Test resource view as_view class method."""
     # Get view function